@@ -2,46 +2,86 @@ import hou
 import os
 
 # -------- 共用：判斷是不是「檔案類」參數 --------
+_FILE_STRING_TYPES = (
+    hou.stringParmType.FileReference,
+    hou.stringParmType.Image,
+    hou.stringParmType.NodeReference,
+)
+# (node type, parm name) -> 是不是檔案類參數；同型別 node 不用每次都建 parmTemplate()
+# 只快取 node type 定義的參數：spare parm 每個 node 可以不一樣（同名不同型別），直接看它自己的 template
+# HDA 定義可能在兩次執行之間改掉，run_reports() 開始時會清空
+_file_parm_cache = {}
+
+def _is_file_parm(parm):
+    pt = parm.parmTemplate()
+    if pt.type() != hou.parmTemplateType.String:
+        return False
+    return pt.stringType() in _FILE_STRING_TYPES
+
 def iter_file_parms(node):
+    type_key = node.type().nameWithCategory()
     for parm in node.parms():
-        pt = parm.parmTemplate()
-        if pt.type() != hou.parmTemplateType.String:
+        if parm.isSpare():
+            if _is_file_parm(parm):
+                yield parm
             continue
-        st = pt.stringType()
-        if st in (
-            hou.stringParmType.FileReference,
-            hou.stringParmType.Image,
-            hou.stringParmType.NodeReference,
-        ):
+        key = (type_key, parm.name())
+        is_file = _file_parm_cache.get(key)
+        if is_file is None:
+            is_file = _file_parm_cache[key] = _is_file_parm(parm)
+        if is_file:
             yield parm
 
-# -------- 找某個路徑是不是被其他 node 使用 --------
-def find_users_of_path(path_str, owner_node):
-    """在整個 scene 裡找有沒有其它節點的參數有包含這個文字"""
-    users = []
-    if not path_str:
-        return users
+# -------- 整個 scene 的參數只掃一次，建成索引 --------
+def build_parm_index(all_nodes=None):
+    """
+    回傳 [(node_path, joined_raw, [(raw, parm_name), ...]), ...]
+    joined_raw 是該 node 所有字串參數用 \0 接起來，查詢時先對它做一次 `in` 就能跳過大部分 node
+    """
+    if all_nodes is None:
+        all_nodes = hou.node("/").allSubChildren()
 
-    all_nodes = hou.node("/").allSubChildren()
+    index = []
     for n in all_nodes:
-        if n == owner_node:
-            continue
+        raws = []
         for p in n.parms():
             try:
                 raw = p.unexpandedString()
             except hou.OperationFailed:
                 continue
-            if not isinstance(raw, str):
+            if not isinstance(raw, str) or not raw:
                 continue
+            raws.append((raw, p.name()))
+        if raws:
+            index.append((n.path(), "\0".join(r for r, _ in raws), raws))
+    return index
+
+# -------- 找某個路徑是不是被其他 node 使用 --------
+def find_users_of_path(path_str, owner_node, parm_index=None):
+    """在整個 scene 裡找有沒有其它節點的參數有包含這個文字（可傳入 build_parm_index() 的結果重複使用）"""
+    users = []
+    if not path_str:
+        return users
+
+    if parm_index is None:
+        parm_index = build_parm_index()
+
+    owner_path = owner_node.path()
+    for node_path, joined, raws in parm_index:
+        if node_path == owner_path or path_str not in joined:
+            continue
+        for raw, parm_name in raws:
             if path_str in raw:
-                users.append("%s.%s" % (n.path(), p.name()))
+                users.append(f"{node_path}.{parm_name}")
                 break  # 一個 node 找到一個就夠了
     return users
 
 # -------- 列出所有 filecache 狀態 --------
-def report_filecaches():
+def report_filecaches(all_nodes=None):
     print("========== FILECACHE REPORT ==========")
-    all_nodes = hou.node("/").allSubChildren()
+    if all_nodes is None:
+        all_nodes = hou.node("/").allSubChildren()
+    parm_index = None  # 第一次需要時才建，之後每個 filecache 共用
 
     for n in all_nodes:
         ntype = n.type().name().lower()
@@ -61,47 +101,60 @@ def report_filecaches():
         display_flag = getattr(n, "isDisplayFlagSet", lambda: False)()
         render_flag  = getattr(n, "isRenderFlagSet",  lambda: False)()
 
-        users = find_users_of_path(out_path, n)
+        if out_path and parm_index is None:
+            parm_index = build_parm_index(all_nodes)
+        users = find_users_of_path(out_path, n, parm_index)
         used_by_others = len(users) > 0
 
-        print("\nNode:   %s" % n.path())
-        print("  Type: %s" % n.type().name())
-        print("  Bypass: %s" % ("YES" if bypass else "no"))
-        print("  DisplayFlag: %s  RenderFlag: %s" % (display_flag, render_flag))
-        print("  Cache Path: %s" % (out_path or "<no path>"))
-        print("  Ref count: %d" % len(users))
+        print(f"\nNode:   {n.path()}")
+        print(f"  Type: {n.type().name()}")
+        print(f"  Bypass: {'YES' if bypass else 'no'}")
+        print(f"  DisplayFlag: {display_flag}  RenderFlag: {render_flag}")
+        print(f"  Cache Path: {out_path or '<no path>'}")
+        print(f"  Ref count: {len(users)}")
         if used_by_others:
             for u in users:
-                print("    -> used in: %s" % u)
+                print(f"    -> used in: {u}")
         else:
             print("    -> (no parameter references this path)")
 
 # -------- 列出所有 ABC / texture / 其他外部檔案 --------
-def report_external_files():
+# tuple 直接給 str.endswith，一次比完所有副檔名
+EXTS_OF_INTEREST = (
+    ".bgeo", ".bgeo.sc", ".abc", ".obj", ".usd", ".usda", ".usdc",
+    ".exr", ".rat", ".png", ".jpg", ".jpeg", ".tif", ".tiff", ".hdr"
+)
+
+def report_external_files(all_nodes=None):
     print("========== EXTERNAL FILES ==========")
-    exts_of_interest = [
-        ".bgeo", ".bgeo.sc", ".abc", ".obj", ".usd", ".usda", ".usdc",
-        ".exr", ".rat", ".png", ".jpg", ".jpeg", ".tif", ".tiff", ".hdr"
-    ]
 
-    all_nodes = hou.node("/").allSubChildren()
+    if all_nodes is None:
+        all_nodes = hou.node("/").allSubChildren()
     for n in all_nodes:
         for parm in iter_file_parms(n):
             raw = parm.unexpandedString()
+            if not raw:
+                continue  # 空的就不用再 evalAsString()
+
             try:
                 val = parm.evalAsString()
             except hou.OperationFailed:
                 val = raw
 
-            if not raw:
-                continue
-
             low = val.lower()
-            if any(low.endswith(ext) for ext in exts_of_interest):
-                print("\nNode: %s" % n.path())
-                print("  Parm: %s" % parm.name())
-                print("  File: %s" % val)
+            if low.endswith(EXTS_OF_INTEREST):
+                print(f"\nNode: {n.path()}")
+                print(f"  Parm: {parm.name()}")
+                print(f"  File: {val}")
+
+# -------- 兩份報表一起跑：整個 scene 只走訪一次 --------
+def run_reports():
+    _file_parm_cache.clear()
+    all_nodes = hou.node("/").allSubChildren()
+    report_filecaches(all_nodes)
+    report_external_files(all_nodes)
 
 # 在 Python Shell 直接呼叫：
+# run_reports()
 # report_filecaches()
 # report_external_files()
@@ -9,16 +9,27 @@
 import os
 import re
 import sys
-import shutil
+import mmap
+import time
+import errno
+import queue
+import atexit
+import stat
 import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 # ======================
 # CONFIG（預設值，可被參數覆蓋 DRY_RUN）
 # ======================
 DRY_RUN = True               # 預設：只模擬
 TARGET_DRIVE = "D:/"         # 目標磁碟機（會保留後面資料夾結構）
-MAX_WORKERS = 8              # 平行複製 thread 數量
+MAX_WORKERS = 8              # 檢查來源（scandir）用的 thread 數量
+SMALL_WORKERS = 64           # 小檔複製 thread 數量：網路磁碟上靠高併發藏延遲
+LARGE_WORKERS = 4            # 大檔複製 thread 數量：頻寬有限，少量併發就滿了
+SMALL_FILE_LIMIT = 4 << 20   # 小於 4 MiB 算小檔
+SKIP_UNCHANGED = False       # 目標已有同大小、修改時間差 < 2 秒的檔案就跳過（重跑同一個 .nk 時幾乎不用搬資料）
 # log 檔寫在腳本所在資料夾，避免權限問題
 LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
                         "copy_reads_log.txt")
@@ -27,21 +38,117 @@ LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
 # ======================
 # LOG 工具
 # ======================
-def log(msg: str):
-    ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    line = f"[{ts}] {msg}"
-    print(line)
+# 寫檔交給背景 thread：log() 只丟進 queue，不會每行都 open / close 一次
+_log_queue = queue.Queue()
+_log_thread = None
+_log_thread_lock = threading.Lock()
+# 檔案用 binary 寫：每行只 encode 一次，換行沿用文字模式時的 os.linesep
+_LOG_EOL = os.linesep.encode("ascii")
+
+
+def _log_writer():
+    fh = None
+    fh_path = None
+    while True:
+        path, data = _log_queue.get()
+        try:
+            if path is None:  # flush_log()：目前的 log 都寫完了，關檔（Windows 上才能改名 / 刪除），下一筆再開
+                if fh is not None:
+                    fh.close()
+                fh = None
+                fh_path = None
+                continue
+            if path != fh_path:
+                if fh is not None:
+                    fh.close()
+                fh = open(path, "ab", buffering=1 << 16)
+                fh_path = path
+            fh.write(data)
+            if _log_queue.empty():
+                fh.flush()
+        except Exception as e:
+            # 寫檔失敗：先關掉舊 handle（下一筆會重新開檔），這一筆改寫到 stderr，不默默丟掉
+            if fh is not None:
+                try:
+                    fh.close()
+                except Exception:
+                    pass
+            fh = None
+            fh_path = None
+            _log_to_stderr(path, data, e)
+        finally:
+            _log_queue.task_done()
+
+
+def _log_to_stderr(path, data, err):
+    if sys.stderr is None:  # pythonw / 無 console 的 GUI
+        return
     try:
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        sys.stderr.write(f"[log] 無法寫入 {path}：{err}\n")
+        sys.stderr.write(data.decode("utf-8", "replace").replace(os.linesep, "\n"))
+        sys.stderr.flush()
     except Exception:
         pass
 
 
+# (秒數, 格式化字串)：同一秒內的 log 共用同一個時間戳，不用每行都 strftime
+_ts_cache = (None, "")
+
+
+def _timestamp():
+    global _ts_cache
+    now = int(time.time())
+    sec, text = _ts_cache  # 整個 tuple 一次讀 / 一次換，多 thread 也不會拿到對不上的值
+    if now != sec:
+        text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _ts_cache = (now, text)
+    return text
+
+
+def _start_log_thread():
+    global _log_thread
+    if _log_thread is None:
+        with _log_thread_lock:
+            if _log_thread is None:
+                _log_thread = threading.Thread(target=_log_writer, name="nk-log", daemon=True)
+                _log_thread.start()
+
+
+def log(msg: str):
+    ts = _timestamp()
+    line = f"[{ts}] {msg}"
+    print(line)
+    _start_log_thread()
+    _log_queue.put((LOG_FILE, line.encode("utf-8") + _LOG_EOL))
+
+
+def log_many(msgs):
+    """一次記多行：共用一個時間戳、一次 print、一次丟進 queue（大量逐檔結果用）"""
+    if not msgs:
+        return
+    ts = _timestamp()
+    text = "\n".join(f"[{ts}] {m}" for m in msgs)
+    print(text)
+    _start_log_thread()
+    _log_queue.put((LOG_FILE, text.replace("\n", os.linesep).encode("utf-8") + _LOG_EOL))
+
+
+def flush_log():
+    """等背景 thread 把目前 queue 裡的 log 全部寫進檔案，並關掉 log 檔"""
+    if _log_thread is not None:
+        _log_queue.put((None, None))
+        _log_queue.join()
+
+
+atexit.register(flush_log)
+
+
 # ======================
 # .nk 解析
 # ======================
 class ReadEntry:
+    __slots__ = ("node_type", "name", "file", "first", "last")
+
     def __init__(self):
         self.node_type = "Read"
         self.name = None
@@ -53,60 +160,116 @@ class ReadEntry:
         return f"<{self.node_type} {self.name} file={self.file} first={self.first} last={self.last}>"
 
 
+# 整份文字裡找 "Read" 這個字：pattern 以字面開頭，regex 引擎可以直接跳著找，
+# 比 ^\s*(Read|DeepRead) 一個位置一個位置試快很多；找到後再檢查同一行前面是不是只有空白 / Deep
+_NK_READ_WORD = re.compile(r'Read\b')
+
+# node 區塊的欄位：name / file / first / last 擇一，用 lastgroup 分派；
+# MULTILINE 直接對整個 node 區塊 finditer（[^\S\n] = 換行以外的空白，不會跨行配到下一行的值）
+_NK_FIELD = re.compile(
+    r'^[^\S\n]*(?:name[^\S\n]+(?P<name>.+)$'
+    r'|file[^\S\n]+(?P<file>.+)$'
+    r'|first[^\S\n]+(?P<first>-?\d+)'
+    r'|last[^\S\n]+(?P<last>-?\d+))',
+    re.M,
+)
+
+_NK_BRACE = re.compile(r'[{}]')
+
+
+def _strip_quotes(val: str) -> str:
+    """去掉 "..." 或 {...} 外框"""
+    val = val.strip()
+    if (val.startswith('"') and val.endswith('"')) or (val.startswith('{') and val.endswith('}')):
+        val = val[1:-1]
+    return val
+
+
+def _find_node_start(text: str, pos: int):
+    """從 pos 往後找下一個 Read / DeepRead node 開頭，回傳 (該行起點, node_type)；找不到回傳 None"""
+    while True:
+        m = _NK_READ_WORD.search(text, pos)
+        if not m:
+            return None
+        line_start = text.rfind("\n", 0, m.start()) + 1
+        head = text[line_start:m.start()]
+        node_type = "Read"
+        if head.endswith("Deep"):
+            node_type = "DeepRead"
+            head = head[:-4]
+        if not head or head.isspace():
+            return line_start, node_type
+        pos = m.end()
+
+
+def _find_node_end(text: str, pos: int, depth: int):
+    """
+    從 pos 開始只看大括號（regex 在 C 裡跳過其他字元），回傳行尾深度 <= 0 的那一行的下一行起點；
+    node 沒有結束（檔案先結束）就回傳 None。深度跟逐行算一樣以「整行算完」為準：
+    同一行裡先關再開（例如 `} {`）不算結束
+    """
+    size = len(text)
+    while True:
+        m = _NK_BRACE.search(text, pos)
+        if m is None:
+            return None
+        depth += 1 if m.group() == "{" else -1
+        pos = m.end()
+        if depth <= 0:
+            line_end = text.find("\n", pos)
+            next_pos = size if line_end < 0 else line_end + 1
+            rest = text[pos:next_pos]
+            depth += rest.count("{") - rest.count("}")
+            if depth <= 0:
+                return next_pos
+            pos = next_pos
+
+
 def parse_nk_for_reads(nk_path):
     """從 .nk 文字解析所有 Read / DeepRead node"""
     reads = []
 
-    with open(nk_path, "r", encoding="utf-8", errors="ignore") as f:
-        lines = f.readlines()
-
-    current = None
-    brace_depth = 0
-
-    re_node_start = re.compile(r'^\s*(Read|DeepRead)\b')
-    re_name = re.compile(r'^\s*name\s+(.+)$')
-    re_file = re.compile(r'^\s*file\s+(.+)$')
-    re_first = re.compile(r'^\s*first\s+(-?\d+)')
-    re_last = re.compile(r'^\s*last\s+(-?\d+)')
-
-    for line in lines:
-        if current is None:
-            m = re_node_start.match(line)
-            if m:
-                current = ReadEntry()
-                current.node_type = m.group(1)
-                brace_depth = line.count("{") - line.count("}")
-                if brace_depth <= 0:
-                    brace_depth = 1
-            continue
-
-        brace_depth += line.count("{") - line.count("}")
-
-        m_name = re_name.match(line)
-        if m_name:
-            val = m_name.group(1).strip()
-            if (val.startswith('"') and val.endswith('"')) or (val.startswith('{') and val.endswith('}')):
-                val = val[1:-1]
-            current.name = val
-
-        m_file = re_file.match(line)
-        if m_file:
-            val = m_file.group(1).strip()
-            if (val.startswith('"') and val.endswith('"')) or (val.startswith('{') and val.endswith('}')):
-                val = val[1:-1]
-            current.file = val
-
-        m_first = re_first.match(line)
-        if m_first:
-            current.first = int(m_first.group(1))
-
-        m_last = re_last.match(line)
-        if m_last:
-            current.last = int(m_last.group(1))
-
+    # 整個檔案一次讀進來，直接跳到下一個 Read / DeepRead 開頭；
+    # node 區塊也不逐行處理：先用大括號找到結尾，再對整段 finditer 抓欄位（迴圈都在 regex 引擎裡）
+    with open(nk_path, "rb") as f:
+        text = f.read().decode("utf-8", errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    size = len(text)
+    pos = 0
+    while True:
+        found = _find_node_start(text, pos)
+        if found is None:
+            break
+        line_start, node_type = found
+
+        line_end = text.find("\n", line_start)
+        pos = size if line_end < 0 else line_end + 1
+        line = text[line_start:pos]
+
+        current = ReadEntry()
+        current.node_type = node_type
+        brace_depth = line.count("{") - line.count("}")
         if brace_depth <= 0:
-            reads.append(current)
-            current = None
+            brace_depth = 1
+
+        end = _find_node_end(text, pos, brace_depth)
+        if end is None:
+            break  # 沒關起來的 node 不算
+
+        for fm in _NK_FIELD.finditer(text, pos, end):
+            key = fm.lastgroup
+            if key == "name":
+                current.name = _strip_quotes(fm.group("name"))
+            elif key == "file":
+                current.file = _strip_quotes(fm.group("file"))
+            elif key == "first":
+                current.first = int(fm.group("first"))
+            elif key == "last":
+                current.last = int(fm.group("last"))
+        reads.append(current)
+        pos = end
 
     return reads
 
@@ -121,6 +284,12 @@ def build_dst_path(src_path: str) -> str:
     return os.path.join(TARGET_DRIVE, rest)
 
 
+# 單一 %d / %0Nd（前後都沒有其他 %）的序列路徑
+_SEQ_RE = re.compile(r"^([^%]*)%(?:0(\d+))?d([^%]*)$")
+# #### 井字序列（每個 Read 都會查一次，先編好）
+_HASH_RE = re.compile(r"#+")
+
+
 def expand_read_to_files(read: ReadEntry):
     """
     將一個 ReadEntry 展開成多個實際檔案路徑（對於序列）。
@@ -140,9 +309,9 @@ def expand_read_to_files(read: ReadEntry):
 
     # ★ 新增：如果有 # 但沒有 %，自動把 #### 轉成 %0Nd
     if "#" in path and "%" not in path:
-        m = re.search(r"(#+)", path)
+        m = _HASH_RE.search(path)
         if m:
-            hashes = m.group(1)
+            hashes = m.group()
             pad = len(hashes)
             fmt = "%%0%dd" % pad   # 4 個 # → %04d
             new_path = path.replace(hashes, fmt)
@@ -153,12 +322,18 @@ def expand_read_to_files(read: ReadEntry):
         first = read.first if read.first is not None else 1
         last = read.last if read.last is not None else first
         log(f"序列 {read.node_type} {read.name}  {first}~{last}  pattern={path}")
-        for f in range(first, last + 1):
-            try:
-                files.append(path % f)
-            except TypeError:
-                files.append(path)
-                break
+        m = _SEQ_RE.match(path)
+        if m:
+            # 只有一個 %d / %0Nd：切成 prefix / pad / suffix，整段用 f-string 一次產生
+            prefix, pad, suffix = m.group(1), int(m.group(2) or 0), m.group(3)
+            files = [f"{prefix}{i:0{pad}d}{suffix}" for i in range(first, last + 1)]
+        else:
+            for f in range(first, last + 1):
+                try:
+                    files.append(path % f)
+                except TypeError:
+                    files.append(path)
+                    break
     else:
         log(f"單檔 {read.node_type} {read.name}  {path}")
         files.append(path)
@@ -166,43 +341,449 @@ def expand_read_to_files(read: ReadEntry):
     return files
 
 
+# ======================
+# 快速複製（取代 shutil.copy2）
+# ======================
+COPY_BUFSIZE = 4 << 20           # fallback readinto 迴圈的緩衝區（4 MiB，每個 thread 配置一次）
+SENDFILE_CHUNK = 1 << 23         # 每次 sendfile 最多搬 8 MiB（每呼叫一次才回 Python 拿一次 GIL）
+MMAP_THRESHOLD = 64 << 20        # fallback 時超過 64 MiB 的檔案改用 mmap 整段寫出
+UNBUFFERED_THRESHOLD = 16 << 20  # unbuffered=True 時，超過 16 MiB 的檔案不經過 Windows 檔案快取
+COPY_FILE_NO_BUFFERING = 0x1000
+PROGRESS_CONTINUE = 0
+PROGRESS_CANCEL = 1
+ERROR_REQUEST_ABORTED = 1235     # CopyFileExW 被 progress routine 取消時的錯誤碼
+
+if sys.platform == "win32":
+    import ctypes
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    # ctypes 呼叫外部函式時會放掉 GIL，多個 worker 的 CopyFile2 可以真的同時跑
+    _CopyFile2 = _kernel32.CopyFile2
+    _CopyFile2.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p)
+    _CopyFile2.restype = ctypes.HRESULT   # 失敗時 ctypes 會直接丟 OSError
+    _CopyFileExW = _kernel32.CopyFileExW
+    _CopyFileExW.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p,
+                             ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32)
+    _CopyFileExW.restype = ctypes.c_int   # BOOL，失敗要自己查 last error
+    # LPPROGRESS_ROUTINE：每搬一段就呼叫一次，回傳 PROGRESS_CANCEL 會中止複製並刪掉目標檔
+    _PROGRESS_ROUTINE = ctypes.WINFUNCTYPE(
+        ctypes.c_uint32, ctypes.c_int64, ctypes.c_int64, ctypes.c_int64, ctypes.c_int64,
+        ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
+else:
+    _CopyFile2 = None
+    _CopyFileExW = None
+
+# macOS：sendfile 只能寫到 socket，改用 fcopyfile（shutil 在 macOS 內部用的同一個 API）
+if sys.platform == "darwin":
+    import posix
+    _fcopyfile = getattr(posix, "_fcopyfile", None)
+else:
+    _fcopyfile = None
+
+
+# Linux 5.3+：copy_file_range 可以跨檔案系統（舊 kernel 回 EXDEV 就退回 sendfile）
+_HAS_COPY_FILE_RANGE = sys.platform.startswith("linux") and hasattr(os, "copy_file_range")
+
+
+_HAS_FADVISE = hasattr(os, "posix_fadvise")  # Linux；macOS / Windows 沒有
+_HAS_FALLOCATE = hasattr(os, "posix_fallocate")
+
+
+# utime / chmod 能直接吃 fd 的平台（Linux / macOS）就不用再用路徑找一次檔案
+_META_BY_FD = os.utime in os.supports_fd and os.chmod in os.supports_fd
+
+
+def _check_stop(stop_event):
+    """
+    搬資料的迴圈在送出下一段之前檢查：按了 Stop 就丟 InterruptedError，不用等大檔整個複製完。
+    最後一段寫完就不再檢查，已經整個複製完的檔案不會因為 Stop 被刪掉
+    """
+    if stop_event is not None and stop_event.is_set():
+        raise InterruptedError("copy cancelled")
+
+
+def _copy_file_range(fsrc, fdst, size: int, stop_event=None) -> bool:
+    """
+    Linux copy_file_range：整段迴圈在 kernel 裡跑，不經過 user space buffer；
+    同一個檔案系統上可以 reflink，CIFS / NFS 4.2 上會變成 server-side copy（資料不用繞回本機）。
+    回傳 False 表示這個檔案系統 / kernel 不支援（交給 sendfile 再試）
+    """
+    in_fd = fsrc.fileno()
+    out_fd = fdst.fileno()
+    offset = 0
+    while True:
+        try:
+            sent = os.copy_file_range(in_fd, out_fd, SENDFILE_CHUNK, offset, offset)
+        except OSError as e:
+            if offset == 0 and e.errno in (errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.ENOTSUP,
+                                           errno.EOPNOTSUPP, errno.EPERM):
+                return False
+            raise
+        if sent == 0:
+            return offset > 0 or size == 0  # 有些檔案系統（例如 procfs）第一次就回 0：交給下一種方式
+        offset += sent
+        if offset < size:
+            _check_stop(stop_event)
+
+
+def _copy_sendfile(fsrc, fdst, size: int, stop_event=None) -> bool:
+    """用 os.sendfile 在 kernel 內搬資料；回傳 False 表示這個檔案系統不支援"""
+    in_fd = fsrc.fileno()
+    out_fd = fdst.fileno()
+    offset = 0
+    while True:
+        try:
+            sent = os.sendfile(out_fd, in_fd, offset, SENDFILE_CHUNK)
+        except OSError as e:
+            if offset == 0 and e.errno in (errno.EINVAL, errno.ENOSYS, errno.ENOTSUP, errno.ENOTSOCK):
+                return False
+            raise
+        if sent == 0:
+            return True
+        offset += sent
+        if offset < size:
+            _check_stop(stop_event)
+
+
+def _copy_fcopyfile(fsrc, fdst) -> bool:
+    """macOS fcopyfile(COPYFILE_DATA)：kernel 內搬資料（APFS 上可直接 clone）；回傳 False 表示不支援"""
+    try:
+        _fcopyfile(fsrc.fileno(), fdst.fileno(), posix._COPYFILE_DATA)
+    except OSError as e:
+        if e.errno in (errno.EINVAL, errno.ENOTSUP):
+            return False
+        raise
+    return True
+
+
+def _write_all(fdst, mv):
+    """unbuffered write 可能只寫一部分（例如單次超過 2 GiB），寫到完為止"""
+    while mv:
+        n = fdst.write(mv)
+        mv = mv[n:]
+
+
+_copy_buf = threading.local()
+
+
+def _copy_readinto(fsrc, fdst, size: int, stop_event=None):
+    """預先配置好的 bytearray + readinto，每個 thread 共用一塊，不會每個檔案 / chunk 都重新配置記憶體"""
+    mv = getattr(_copy_buf, "mv", None)
+    if mv is None:
+        mv = _copy_buf.mv = memoryview(bytearray(COPY_BUFSIZE))
+    done = 0
+    while True:
+        n = fsrc.readinto(mv)
+        if not n:
+            break
+        _write_all(fdst, mv if n == COPY_BUFSIZE else mv[:n])  # 整塊讀滿時連 slice 的 view 都不用建
+        done += n
+        if done < size:
+            _check_stop(stop_event)
+
+
+def _copy_mmap(fsrc, fdst, stop_event=None):
+    """大檔：整個來源 mmap 起來直接寫出，交給 OS page cache 搬；要能中途取消時改成每 SENDFILE_CHUNK 寫一段"""
+    with mmap.mmap(fsrc.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        mv = memoryview(mm)
+        try:
+            if stop_event is None:
+                _write_all(fdst, mv)
+            else:
+                for i in range(0, len(mv), SENDFILE_CHUNK):
+                    if i:
+                        _check_stop(stop_event)
+                    _write_all(fdst, mv[i:i + SENDFILE_CHUNK])
+        finally:
+            mv.release()  # 先放掉 view，mmap 才關得掉
+
+
+# 原生複製回這些錯誤碼代表「這個檔案系統 / 分享不支援」，改走可攜版本再試一次；
+# 其他錯誤（權限、找不到檔案…）照樣丟出去
+# ERROR_INVALID_FUNCTION / ERROR_NOT_SUPPORTED / ERROR_INVALID_PARAMETER / ERROR_CALL_NOT_IMPLEMENTED
+_NATIVE_UNSUPPORTED = {1, 50, 87, 120}
+
+
+def _native_unsupported(e: OSError) -> bool:
+    # CopyFile2 的 HRESULT 是 0x8007xxxx，低 16 bit 就是 Win32 錯誤碼
+    code = getattr(e, "winerror", None)
+    return code is not None and (code & 0xFFFF) in _NATIVE_UNSUPPORTED
+
+
+def _fadvise(fd: int, advice: int):
+    """posix_fadvise 只是提示：檔案系統不支援（例如某些網路磁碟）就當沒這回事"""
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def _copy_portable(src_path: str, dst_path: str, stop_event=None, unbuffered: bool = False):
+    """
+    copy_file_range / sendfile / fcopyfile / mmap / readinto 其中一種搬資料，再用複製前的 fstat 設定時間戳 + 權限。
+    大檔（>= UNBUFFERED_THRESHOLD）先告訴 kernel 會循序讀（預讀開大）；
+    unbuffered=True 時複製完再把來源 / 目標丟出 page cache（等同 Windows 的 COPY_FILE_NO_BUFFERING：
+    備份用的大檔不會把常用的快取擠掉；預設保留，複製到本機馬上要開的素材還能直接從快取讀）
+    """
+    with open(src_path, "rb", buffering=0) as fsrc, open(dst_path, "wb", buffering=0) as fdst:
+        st = os.fstat(fsrc.fileno())
+        if st.st_size < UNBUFFERED_THRESHOLD:
+            stop_event = None  # 小檔很快就完成，不在中途檢查 Stop（呼叫端在檔案之間檢查）
+        advise = _HAS_FADVISE and st.st_size >= UNBUFFERED_THRESHOLD
+        if advise:
+            _fadvise(fsrc.fileno(), os.POSIX_FADV_SEQUENTIAL)
+        try:
+            if _fcopyfile is not None:
+                done = _copy_fcopyfile(fsrc, fdst)  # 一次呼叫做完，中途不能取消
+            else:
+                done = (_HAS_COPY_FILE_RANGE and _copy_file_range(fsrc, fdst, st.st_size, stop_event)) \
+                    or (hasattr(os, "sendfile") and _copy_sendfile(fsrc, fdst, st.st_size, stop_event))
+            if not done:
+                # 自己寫資料的路徑才先配好整個目標大小（ext4 / XFS 一次配成連續空間，不用邊寫邊長 extent）；
+                # kernel 內複製的路徑不配：會擋掉 reflink / server-side copy
+                if _HAS_FALLOCATE and st.st_size >= UNBUFFERED_THRESHOLD:
+                    try:
+                        os.posix_fallocate(fdst.fileno(), 0, st.st_size)
+                    except OSError:
+                        pass  # 不支援（tmpfs 舊版、網路磁碟）就照常邊寫邊配
+                if st.st_size > MMAP_THRESHOLD:
+                    _copy_mmap(fsrc, fdst, stop_event)
+                else:
+                    _copy_readinto(fsrc, fdst, st.st_size, stop_event)
+        except InterruptedError:
+            fdst.close()
+            os.unlink(dst_path)  # 取消時不留下只寫一半的檔案
+            raise
+        if advise and unbuffered:
+            _fadvise(fsrc.fileno(), os.POSIX_FADV_DONTNEED)
+            _fadvise(fdst.fileno(), os.POSIX_FADV_DONTNEED)  # 同時開始把髒頁寫回，寫完的頁就能丟
+        if _META_BY_FD:
+            os.chmod(fdst.fileno(), stat.S_IMODE(st.st_mode))
+            os.utime(fdst.fileno(), ns=(st.st_atime_ns, st.st_mtime_ns))
+    if not _META_BY_FD:
+        os.utime(dst_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.chmod(dst_path, stat.S_IMODE(st.st_mode))  # 最後才設，唯讀檔也能先改時間
+
+
+def _cancel_routine(stop_event):
+    """給 CopyFileExW 的 progress routine：Stop 之後回 PROGRESS_CANCEL"""
+    def routine(*_args):
+        return PROGRESS_CANCEL if stop_event.is_set() else PROGRESS_CONTINUE
+    return _PROGRESS_ROUTINE(routine)
+
+
+def fast_copy(src_path: str, dst_path: str, unbuffered: bool = False, stop_event=None, size=None):
+    """
+    複製單一檔案（含時間戳 / 權限），取代 shutil.copy2。
+      - Windows：kernel32.CopyFile2（原生複製，metadata 一起保留）；
+        unbuffered=True 且檔案 >= UNBUFFERED_THRESHOLD 時改用 CopyFileExW + COPY_FILE_NO_BUFFERING，
+        大型 EXR / MOV 不用再繞一圈檔案快取（小檔不適用，會變慢）；
+        分享不支援原生複製時自動改走下面的可攜版本
+      - Linux：os.copy_file_range，不支援再用 os.sendfile（資料不經過 Python）
+      - macOS：fcopyfile
+      - 其他 / 不支援時：大檔用 mmap，小檔用 4 MiB bytearray + readinto 迴圈
+      - 非 Windows 的 unbuffered=True：大檔複製完用 posix_fadvise(DONTNEED) 丟出 page cache
+    非 Windows 的 metadata 直接用開著的 fd 設定（時間戳 + 權限），沿用複製前那一次 fstat，
+    不再跑 shutil.copystat 重新 stat + 用路徑 utime / chmod（xattr / flags 不複製）
+    有給 stop_event 時，大檔（>= UNBUFFERED_THRESHOLD）複製到一半按 Stop 也會中止：
+    丟 InterruptedError，且不留下寫一半的目標檔（小檔很快就完成，不另外檢查）；
+    Windows 只有 unbuffered=True 走 CopyFileExW 時才會中途中止，一般情況維持 CopyFile2
+    （不掛 Python 進度回呼，省下每個 chunk 一次 callback），Stop 在檔案之間生效
+    size：呼叫端已從 scandir 拿到的檔案大小；有給就不用再 stat 一次來源（網路磁碟上每次 stat 都是一趟來回）
+    """
+    if _CopyFile2 is not None:
+        try:
+            if unbuffered and size is None:
+                size = os.path.getsize(src_path)
+            if unbuffered and size >= UNBUFFERED_THRESHOLD:
+                progress = _cancel_routine(stop_event) if stop_event is not None else None
+                if not _CopyFileExW(src_path, dst_path, progress, None, None, COPY_FILE_NO_BUFFERING):
+                    code = ctypes.get_last_error()
+                    if code == ERROR_REQUEST_ABORTED:
+                        raise InterruptedError("copy cancelled")
+                    raise ctypes.WinError(code)
+            else:
+                _CopyFile2(src_path, dst_path, None)
+            return
+        except OSError as e:
+            if not _native_unsupported(e):
+                raise
+
+    _copy_portable(src_path, dst_path, stop_event, unbuffered)
+
+
 # ======================
 # 複製 worker（平行用）
 # ======================
-def copy_worker(src_path: str):
+def list_dir_stats(dir_path: str, wanted):
     """
-    平行複製 worker。
-    回傳 (status, src, dst, error_msg)
-      status: "ok" / "missing" / "error" / "dry_run"
+    一次 scandir 找出 wanted（已 normcase 的檔名）裡存在的檔案，回傳 {name: (size, mtime_ns)}。
+    只對要的檔案 stat（Windows 上 scandir 已帶大小 / 時間，不會多一次 I/O）；
+    stat 失敗的檔案記成 (0, None)；資料夾不存在 / 讀不到就回傳空 dict。
+    """
+    stats = {}
+    try:
+        with os.scandir(dir_path or ".") as it:
+            for e in it:
+                name = os.path.normcase(e.name)
+                if name in wanted:
+                    try:
+                        st = e.stat()
+                        stats[name] = (st.st_size, st.st_mtime_ns)
+                    except OSError:
+                        stats[name] = (0, None)
+    except OSError:
+        pass
+    return stats
+
+
+def scan_dir(dir_path: str, wanted):
+    """
+    檢查一個來源資料夾：回傳 (dir_path, 來源 stats, 目標 stats)。
+    SKIP_UNCHANGED 時順便把對應的目標資料夾也列一次（同樣一個資料夾一次 scandir），否則目標 stats 是空 dict
+    """
+    src_stats = list_dir_stats(dir_path, wanted)
+    dst_stats = list_dir_stats(build_dst_path(dir_path), wanted) if SKIP_UNCHANGED and src_stats else {}
+    return dir_path, src_stats, dst_stats
+
+
+def is_unchanged(src_stat, dst_stat) -> bool:
+    """大小相同、修改時間差 < 2 秒（FAT / exFAT 的時間精度；複製會保留來源的修改時間）"""
+    if dst_stat is None or src_stat[1] is None or dst_stat[1] is None:
+        return False
+    return src_stat[0] == dst_stat[0] and abs(src_stat[1] - dst_stat[1]) < 2_000_000_000
+
+
+def make_dst_dirs(dst_paths, ensured=None):
     """
-    if not os.path.exists(src_path):
-        return ("missing", src_path, None, "source not found")
+    所有目標資料夾先去重、一次建好；失敗就略過，讓之後的複製回報錯誤。
+    ensured：這次複製已經建過的資料夾（normcase 過），有給就跳過裡面的、並把新建的加進去
+    （同一個資料夾在 .nk 裡用 / 和 \\ 混寫時，也只建一次）。
+    先直接 mkdir（上層通常已存在，一次 syscall），上層不存在才退回 makedirs（它每層會先 stat）
+    """
+    for d in {os.path.dirname(p) for p in dst_paths}:
+        key = os.path.normcase(os.path.normpath(d))
+        if ensured is not None:
+            if key in ensured:
+                continue
+            ensured.add(key)
+        try:
+            os.mkdir(d)
+        except FileNotFoundError:
+            try:
+                os.makedirs(d, exist_ok=True)
+            except OSError:
+                pass
+        except OSError:
+            pass  # 已存在（FileExistsError）或建不了：交給複製回報
 
-    dst_path = build_dst_path(src_path)
 
+def copy_file(src_path: str, dst_path: str, size=None):
+    """
+    已確認來源存在後的複製步驟（size：列資料夾時拿到的大小，直接交給 fast_copy）。
+    回傳 (status, src, dst, error_msg)
+      status: "ok" / "error" / "dry_run"
+    """
     if DRY_RUN:
         return ("dry_run", src_path, dst_path, None)
 
     try:
-        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-        shutil.copy2(src_path, dst_path)
+        fast_copy(src_path, dst_path, size=size)  # 目標資料夾由呼叫端先建好
         return ("ok", src_path, dst_path, None)
     except Exception as e:
         return ("error", src_path, dst_path, str(e))
 
 
+def iter_copy_results(sources):
+    """
+    邊檢查邊複製所有來源檔案，yield (status, src, dst, error_msg)：
+      1. 檢查存在：依來源資料夾分組，每個資料夾只 scandir 一次（序列幾千張也只要一次）
+      2. 複製：某個資料夾一列完，就建好它的目標資料夾、把檔案排進複製佇列，
+         不用等所有資料夾都列完才開始複製（第一張開始複製的時間不再跟整個 .nk 的大小成正比）；
+         依大小分兩個 pool 同時跑：小檔（< SMALL_FILE_LIMIT）走 SMALL_WORKERS 高併發，
+         大檔走 LARGE_WORKERS 低併發；每個 pool 在飛的 future 有上限，完成一個補一個，不會一次堆上百萬個
+      3. SKIP_UNCHANGED：目標已有同大小、同修改時間的檔案直接回報 "skipped"，不送進複製佇列
+    """
+    by_dir = defaultdict(list)
+    for src in sources:
+        by_dir[os.path.dirname(src)].append(src)
+    ensured = set()
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as scan_pool, \
+            ThreadPoolExecutor(max_workers=SMALL_WORKERS) as small_pool, \
+            ThreadPoolExecutor(max_workers=LARGE_WORKERS) as large_pool:
+        listing = {
+            scan_pool.submit(scan_dir, d, {os.path.normcase(os.path.basename(s)) for s in srcs})
+            for d, srcs in by_dir.items()
+        }
+        # [pool, 待送出的檔案, 在飛上限, 在飛的 future]
+        small, large = [small_pool, deque(), SMALL_WORKERS * 4, set()], [large_pool, deque(), LARGE_WORKERS * 2, set()]
+        lanes = (small, large)
+        while True:
+            for pool, queued, limit, pending in lanes:
+                while queued and len(pending) < limit:
+                    pending.add(pool.submit(copy_file, *queued.popleft()))
+
+            all_pending = listing | small[3] | large[3]
+            if not all_pending:
+                break
+            done, _ = wait(all_pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                if fut in listing:
+                    listing.discard(fut)
+                    dir_path, src_stats, dst_stats = fut.result()
+                    # 同一個資料夾的目標路徑前綴只算一次，每個檔案只接上檔名
+                    dst_prefix = os.path.join(build_dst_path(dir_path), "")
+                    dsts = []
+                    for src in by_dir.pop(dir_path):
+                        base = os.path.basename(src)
+                        name = os.path.normcase(base)
+                        st = src_stats.get(name)
+                        if st is None:
+                            yield ("missing", src, None, "source not found")
+                            continue
+                        dst = dst_prefix + base
+                        if dst_stats and is_unchanged(st, dst_stats.get(name)):
+                            yield ("skipped", src, dst, None)
+                            continue
+                        size = st[0]
+                        dsts.append(dst)
+                        (small if size < SMALL_FILE_LIMIT else large)[1].append((src, dst, size))
+                    if dsts and not DRY_RUN:
+                        make_dst_dirs(dsts, ensured)  # 下一輪送出複製前就先建好
+                else:
+                    small[3].discard(fut)
+                    large[3].discard(fut)
+                    yield fut.result()
+
+
 # ======================
 # 主流程
 # ======================
+def _int_arg(args, flag, default):
+    """從 args 取 `flag N` 的整數值，沒帶就回傳 default"""
+    if flag not in args:
+        return default
+    i = args.index(flag)
+    try:
+        return max(1, int(args[i + 1]))
+    except (IndexError, ValueError):
+        print(f"{flag} 後面要接正整數")
+        sys.exit(1)
+
+
 def main():
-    global DRY_RUN
+    global DRY_RUN, SMALL_WORKERS, LARGE_WORKERS, SKIP_UNCHANGED
 
     if len(sys.argv) < 2:
         print("用法：")
-        print("  py copy_reads_nk_parser.py script.nk [--dry | --copy]")
+        print("  py copy_reads_nk_parser.py script.nk [--dry | --copy] [--skip-unchanged] "
+              "[--small-workers N] [--large-workers N]")
         print("")
         print("  --dry   只模擬（預設模式）")
         print("  --copy  真的複製檔案到目標磁碟")
+        print("  --skip-unchanged  目標已有同大小、同修改時間的檔案就跳過")
+        print(f"  --small-workers N  小檔（< {SMALL_FILE_LIMIT >> 20} MiB）複製 thread 數（預設 {SMALL_WORKERS}）")
+        print(f"  --large-workers N  大檔複製 thread 數（預設 {LARGE_WORKERS}）")
         sys.exit(1)
 
     nk_path = sys.argv[1]
@@ -214,6 +795,11 @@ def main():
     elif "--dry" in extra_args:
         DRY_RUN = True
     # 若沒帶參數，就用預設 True
+    if "--skip-unchanged" in extra_args:
+        SKIP_UNCHANGED = True
+
+    SMALL_WORKERS = _int_arg(extra_args, "--small-workers", SMALL_WORKERS)
+    LARGE_WORKERS = _int_arg(extra_args, "--large-workers", LARGE_WORKERS)
 
     print(f"DRY_RUN = {DRY_RUN}")
 
@@ -226,23 +812,28 @@ def main():
         f.write("=== copy_reads_nk_parser.py log ===\n")
         f.write(f"Started at {datetime.datetime.now().isoformat()}\n")
         f.write(f"NK: {nk_path}\n")
-        f.write(f"DRY_RUN={DRY_RUN}, TARGET_DRIVE={TARGET_DRIVE}, MAX_WORKERS={MAX_WORKERS}\n\n")
+        f.write(f"DRY_RUN={DRY_RUN}, TARGET_DRIVE={TARGET_DRIVE}, MAX_WORKERS={MAX_WORKERS}, "
+                f"SMALL_WORKERS={SMALL_WORKERS}, LARGE_WORKERS={LARGE_WORKERS}, "
+                f"SKIP_UNCHANGED={SKIP_UNCHANGED}\n\n")
 
     log(f"開始解析 .nk：{nk_path}")
     reads = parse_nk_for_reads(nk_path)
     log(f"找到 Read/DeepRead 節點數量：{len(reads)}")
 
-    all_sources = []
+    # dict 當作有順序的 set：邊展開邊去重，不用先堆一個大 list 再 sorted(set(...))
+    unique_sources = {}
+    expanded_count = 0
     for r in reads:
-        all_sources.extend(expand_read_to_files(r))
+        files = expand_read_to_files(r)
+        expanded_count += len(files)
+        unique_sources.update(dict.fromkeys(files))
 
-    if not all_sources:
+    if not unique_sources:
         log("沒有任何來源檔案（可能所有 Read 都是表達式或空）")
         return
 
-    unique_sources = sorted(set(all_sources))
     total = len(unique_sources)
-    log(f"展開後來源檔案數量：{len(all_sources)}")
+    log(f"展開後來源檔案數量：{expanded_count}")
     log(f"去重後實際要處理：{total}")
     log(f"Log 檔案位置：{os.path.abspath(LOG_FILE)}")
 
@@ -250,11 +841,15 @@ def main():
     missing = []
     errors = []
     dryrun = []
+    skipped = []
 
     log("開始平行複製檔案...")
 
     done_count = 0
 
+    # 進度條最多重畫 ~200 次，不要每個檔案都 flush stdout
+    progress_step = max(1, total // 200)
+
     def print_progress():
         percent = (done_count / total) * 100.0
         bar_len = 30
@@ -265,47 +860,49 @@ def main():
 
     print_progress()
 
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        future_to_src = {executor.submit(copy_worker, src): src for src in unique_sources}
-
-        for fut in as_completed(future_to_src):
-            status, src, dst, err = fut.result()
-            done_count += 1
+    for status, src, dst, err in iter_copy_results(unique_sources):
+        done_count += 1
+        if done_count % progress_step == 0 or done_count == total:
             print_progress()
 
-            if status == "ok":
-                success.append(src)
-                log(f"成功複製：{src}  ->  {dst}")
-            elif status == "dry_run":
-                dryrun.append(src)
-                log(f"[DRY_RUN] 模擬複製：{src}  ->  {dst}")
-            elif status == "missing":
-                missing.append(src)
-                log(f"❌ 找不到來源檔案：{src}")
-            elif status == "error":
-                errors.append(src)
-                log(f"❌ 複製失敗：{src}  ->  {dst}  原因：{err}")
+        if status == "ok":
+            success.append(src)
+            log(f"成功複製：{src}  ->  {dst}")
+        elif status == "dry_run":
+            dryrun.append(src)
+            log(f"[DRY_RUN] 模擬複製：{src}  ->  {dst}")
+        elif status == "skipped":
+            skipped.append(src)
+            log(f"略過（目標相同）：{src}  ->  {dst}")
+        elif status == "missing":
+            missing.append(src)
+            log(f"❌ 找不到來源檔案：{src}")
+        elif status == "error":
+            errors.append(src)
+            log(f"❌ 複製失敗：{src}  ->  {dst}  原因：{err}")
 
     sys.stdout.write("\n")
     log("========================================")
     log("複製流程結束，統計如下：")
     log(f"  成功複製：{len(success)}")
     log(f"  模擬複製 (DRY_RUN)：{len(dryrun)}")
+    log(f"  略過（目標相同）：{len(skipped)}")
     log(f"  缺少來源檔案：{len(missing)}")
     log(f"  複製失敗：{len(errors)}")
     log("========================================")
 
     if missing:
         log("缺少來源檔案清單：")
-        for p in missing:
+        for p in sorted(missing):
             log(f"  MISSING: {p}")
 
     if errors:
         log("複製失敗清單：")
-        for p in errors:
+        for p in sorted(errors):
             log(f"  ERROR: {p}")
 
     log("全部完成。")
+    flush_log()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+import importlib
+import sys
+import types
+
+import pytest
+
+
+class _Template:
+    def __init__(self, type_, string_type=None):
+        self._type = type_
+        self._string_type = string_type
+
+    def type(self):
+        return self._type
+
+    def stringType(self):
+        return self._string_type
+
+
+class _Parm:
+    def __init__(self, name, template, spare=False):
+        self._name = name
+        self._template = template
+        self._spare = spare
+        self.template_calls = 0
+
+    def name(self):
+        return self._name
+
+    def isSpare(self):
+        return self._spare
+
+    def parmTemplate(self):
+        self.template_calls += 1
+        return self._template
+
+
+class _Node:
+    def __init__(self, type_name, parms):
+        self._type = types.SimpleNamespace(nameWithCategory=lambda: type_name)
+        self._parms = parms
+
+    def type(self):
+        return self._type
+
+    def parms(self):
+        return self._parms
+
+
+@pytest.fixture
+def hac(monkeypatch):
+    # Just enough of the hou module for the file-parm helpers; Houdini isn't available outside Houdini
+    hou = types.ModuleType("hou")
+    hou.stringParmType = types.SimpleNamespace(FileReference="file", Image="image", NodeReference="node",
+                                               Regular="regular")
+    hou.parmTemplateType = types.SimpleNamespace(String="string", Int="int")
+    hou.OperationFailed = type("OperationFailed", (Exception,), {})
+    monkeypatch.setitem(sys.modules, "hou", hou)
+    monkeypatch.delitem(sys.modules, "hou_archive_cache_list", raising=False)
+    return importlib.import_module("hou_archive_cache_list")
+
+
+def _file_parm(name, spare=False):
+    return _Parm(name, _Template("string", "file"), spare)
+
+
+def _int_parm(name, spare=False):
+    return _Parm(name, _Template("int"), spare)
+
+
+def test_type_parms_are_cached_per_node_type(hac):
+    nodes = [_Node("Sop/file", [_file_parm("file"), _int_parm("frame")]) for _ in range(3)]
+    found = [[p.name() for p in hac.iter_file_parms(n)] for n in nodes]
+    assert found == [["file"]] * 3
+    # Only the first node of the type builds parmTemplate()
+    assert [p.template_calls for n in nodes for p in n.parms()] == [1, 1, 0, 0, 0, 0]
+
+
+def test_spare_parms_use_their_own_template(hac):
+    # Same type, same spare parm name, different parm type per node
+    a = _Node("Sop/null", [_file_parm("extra", spare=True)])
+    b = _Node("Sop/null", [_int_parm("extra", spare=True)])
+    c = _Node("Sop/null", [_file_parm("extra", spare=True)])
+    assert [[p.name() for p in hac.iter_file_parms(n)] for n in (a, b, c)] == [["extra"], [], ["extra"]]
+
+
+def test_run_reports_clears_the_cache(hac, monkeypatch):
+    hac._file_parm_cache[("Sop/file", "file")] = True
+    root = types.SimpleNamespace(allSubChildren=lambda: [])
+    monkeypatch.setattr(hac.hou, "node", lambda path: root, raising=False)
+    monkeypatch.setattr(hac, "report_filecaches", lambda nodes: None)
+    monkeypatch.setattr(hac, "report_external_files", lambda nodes: None)
+    hac.run_reports()
+    assert hac._file_parm_cache == {}
@@ -0,0 +1,151 @@
+import errno
+import os
+import threading
+
+import pytest
+
+import nuke_copy_reads_nk_parser as nk
+
+
+def _unsupported(code):
+    def fail(*_args):
+        raise OSError(code, os.strerror(code))
+    return fail
+
+
+@pytest.fixture
+def src(tmp_path):
+    path = tmp_path / "src.bin"
+    path.write_bytes(os.urandom(3 * 1024 * 1024 + 123))
+    os.utime(path, ns=(1_500_000_000_000_000_000, 1_600_000_000_123_456_789))
+    return path
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Record which copy strategy actually moved the data"""
+    seen = []
+    for name in ("_copy_file_range", "_copy_sendfile", "_copy_mmap", "_copy_readinto"):
+        real = getattr(nk, name)
+
+        def spy(*args, _real=real, _name=name, **kwargs):
+            seen.append(_name)
+            return _real(*args, **kwargs)
+        monkeypatch.setattr(nk, name, spy)
+    return seen
+
+
+def _assert_copied(src, dst):
+    assert dst.read_bytes() == src.read_bytes()
+    assert os.stat(dst).st_mtime_ns == os.stat(src).st_mtime_ns
+
+
+def _run(src, tmp_path, **kwargs):
+    dst = tmp_path / "dst.bin"
+    nk._copy_portable(str(src), str(dst), **kwargs)
+    _assert_copied(src, dst)
+
+
+@pytest.mark.skipif(not nk._HAS_COPY_FILE_RANGE, reason="needs os.copy_file_range (Linux)")
+def test_copy_file_range_first(src, tmp_path, calls):
+    _run(src, tmp_path)
+    assert calls == ["_copy_file_range"]
+
+
+@pytest.mark.skipif(not nk._HAS_COPY_FILE_RANGE, reason="needs os.copy_file_range (Linux)")
+def test_exdev_falls_back_to_sendfile(src, tmp_path, calls, monkeypatch):
+    monkeypatch.setattr(os, "copy_file_range", _unsupported(errno.EXDEV))
+    _run(src, tmp_path)
+    assert calls == ["_copy_file_range", "_copy_sendfile"]
+
+
+@pytest.mark.skipif(not hasattr(os, "sendfile") or nk._fcopyfile is not None, reason="needs os.sendfile")
+def test_no_kernel_copy_falls_back_to_readinto(src, tmp_path, calls, monkeypatch):
+    monkeypatch.setattr(os, "copy_file_range", _unsupported(errno.ENOSYS), raising=False)
+    monkeypatch.setattr(os, "sendfile", _unsupported(errno.EINVAL))
+    _run(src, tmp_path)
+    assert calls[-1] == "_copy_readinto"
+
+
+@pytest.mark.skipif(not hasattr(os, "sendfile") or nk._fcopyfile is not None, reason="needs os.sendfile")
+def test_large_file_falls_back_to_mmap(src, tmp_path, calls, monkeypatch):
+    monkeypatch.setattr(os, "copy_file_range", _unsupported(errno.ENOSYS), raising=False)
+    monkeypatch.setattr(os, "sendfile", _unsupported(errno.EINVAL))
+    monkeypatch.setattr(nk, "MMAP_THRESHOLD", 1 << 20)
+    monkeypatch.setattr(nk, "UNBUFFERED_THRESHOLD", 1 << 20)  # fallocate + fadvise paths too
+    _run(src, tmp_path, unbuffered=True)
+    assert calls[-1] == "_copy_mmap"
+
+
+def test_other_errors_are_raised(src, tmp_path, monkeypatch):
+    monkeypatch.setattr(os, "copy_file_range", _unsupported(errno.EIO), raising=False)
+    monkeypatch.setattr(os, "sendfile", _unsupported(errno.EIO), raising=False)
+    with pytest.raises(OSError) as info:
+        nk._copy_portable(str(src), str(tmp_path / "dst.bin"))
+    assert info.value.errno == errno.EIO
+
+
+def test_stop_removes_partial_file(src, tmp_path, monkeypatch):
+    monkeypatch.setattr(os, "copy_file_range", _unsupported(errno.ENOSYS), raising=False)
+    monkeypatch.setattr(os, "sendfile", _unsupported(errno.EINVAL), raising=False)
+    monkeypatch.setattr(nk, "UNBUFFERED_THRESHOLD", 1 << 20)
+    monkeypatch.setattr(nk, "COPY_BUFSIZE", 1 << 20)
+    monkeypatch.setattr(nk._copy_buf, "mv", None, raising=False)
+    stop = threading.Event()
+    stop.set()
+    dst = tmp_path / "dst.bin"
+    with pytest.raises(InterruptedError):
+        nk._copy_portable(str(src), str(dst), stop_event=stop)
+    assert not dst.exists()
+
+
+@pytest.mark.skipif(not nk._HAS_COPY_FILE_RANGE, reason="needs os.copy_file_range (Linux)")
+def test_stop_keeps_a_finished_kernel_copy(src, tmp_path, monkeypatch):
+    # The whole file fits in one copy_file_range call: once it returns the file is complete
+    monkeypatch.setattr(nk, "UNBUFFERED_THRESHOLD", 1 << 20)
+    stop = threading.Event()
+    stop.set()
+    _run(src, tmp_path, stop_event=stop)
+
+
+def test_stop_during_last_chunk_keeps_the_file(src, tmp_path, monkeypatch):
+    monkeypatch.setattr(os, "copy_file_range", _unsupported(errno.ENOSYS), raising=False)
+    monkeypatch.setattr(os, "sendfile", _unsupported(errno.EINVAL), raising=False)
+    monkeypatch.setattr(nk, "UNBUFFERED_THRESHOLD", 1 << 20)
+    monkeypatch.setattr(nk, "COPY_BUFSIZE", 1 << 20)
+    monkeypatch.setattr(nk._copy_buf, "mv", None, raising=False)
+    stop = threading.Event()
+    real_write_all = nk._write_all
+
+    def write_then_stop_at_end(fdst, mv):
+        real_write_all(fdst, mv)
+        if fdst.tell() == os.path.getsize(src):
+            stop.set()
+    monkeypatch.setattr(nk, "_write_all", write_then_stop_at_end)
+    _run(src, tmp_path, stop_event=stop)
+
+
+def test_stop_does_not_cancel_small_files(tmp_path):
+    src = tmp_path / "small.bin"
+    src.write_bytes(b"abc")
+    stop = threading.Event()
+    stop.set()
+    _run(src, tmp_path, stop_event=stop)
+
+
+def test_fast_copy_copies(src, tmp_path):
+    dst = tmp_path / "dst.bin"
+    nk.fast_copy(str(src), str(dst), stop_event=threading.Event(), size=os.path.getsize(src))
+    _assert_copied(src, dst)
+
+
+@pytest.mark.parametrize("winerror, expected", [
+    (1, True), (50, True), (87, True), (120, True),
+    (-2147024846, True),   # HRESULT_FROM_WIN32(ERROR_NOT_SUPPORTED)
+    (5, False), (2, False), (None, False),
+])
+def test_native_unsupported(winerror, expected):
+    e = OSError(errno.EINVAL, "x")
+    if winerror is not None:
+        e.winerror = winerror
+    assert nk._native_unsupported(e) is expected
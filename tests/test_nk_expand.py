@@ -0,0 +1,58 @@
+import re
+
+import pytest
+
+import nuke_copy_reads_nk_parser as nk
+
+
+@pytest.fixture(autouse=True)
+def _no_log(monkeypatch):
+    monkeypatch.setattr(nk, "log", lambda msg: None)
+
+
+def _read(file, first=None, last=None):
+    r = nk.ReadEntry()
+    r.name = "Read1"
+    r.file = file
+    r.first = first
+    r.last = last
+    return r
+
+
+def reference_expand(path, first, last):
+    """Original per-frame % formatting, the spec for the single f-string fast path"""
+    path = path.strip()
+    if "#" in path and "%" not in path:
+        hashes = re.search(r"#+", path).group()
+        path = path.replace(hashes, f"%0{len(hashes)}d")
+    if "%" not in path:
+        return [path]
+    first = first if first is not None else 1
+    last = last if last is not None else first
+    files = []
+    for f in range(first, last + 1):
+        try:
+            files.append(path % f)
+        except TypeError:
+            files.append(path)
+            break
+    return files
+
+
+@pytest.mark.parametrize("path", [
+    "Y:/sh/plate.%04d.exr", "Y:/sh/plate.%d.exr", "Y:/sh/plate.####.exr", "Y:/sh/plate.#.exr",
+    "Y:/sh/plate_%03d", "  Y:/sh/pad.%04d.exr  ", "Y:/sh/still.exr", "Y:/sh/a.%04d.b.%04d.exr",
+])
+@pytest.mark.parametrize("first, last", [(1001, 1005), (-3, 2), (7, 7), (None, None), (5, None), (None, 3)])
+def test_expand_matches_reference(path, first, last):
+    assert nk.expand_read_to_files(_read(path, first, last)) == reference_expand(path, first, last)
+
+
+def test_expand_sequence():
+    assert nk.expand_read_to_files(_read("Y:/sh/p.####.exr", 9, 11)) == [
+        "Y:/sh/p.0009.exr", "Y:/sh/p.0010.exr", "Y:/sh/p.0011.exr"]
+
+
+@pytest.mark.parametrize("path", ["", "   ", None, "[python nuke.script_directory()]/p.%04d.exr"])
+def test_expand_skips_empty_and_tcl(path):
+    assert nk.expand_read_to_files(_read(path, 1, 3)) == []
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+import nuke_copy_reads_nk_parser as nk
+
+
+def test_log_write_failure_falls_back_to_stderr(tmp_path, monkeypatch, capsys):
+    # A directory can't be opened for append: the line goes to stderr instead of being dropped
+    monkeypatch.setattr(nk, "LOG_FILE", str(tmp_path))
+    nk.log("lost line")
+    nk.flush_log()
+    assert "lost line" in capsys.readouterr().err
+
+    # The writer recovers and opens the next log file normally
+    log_file = tmp_path / "copy.log"
+    monkeypatch.setattr(nk, "LOG_FILE", str(log_file))
+    nk.log_many(["one", "two"])
+    nk.flush_log()
+    text = log_file.read_text(encoding="utf-8")
+    assert "one" in text and "two" in text
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc to list open files")
+def test_flush_log_closes_the_log_file(tmp_path, monkeypatch):
+    log_file = tmp_path / "copy.log"
+    monkeypatch.setattr(nk, "LOG_FILE", str(log_file))
+    nk.log("line")
+    nk.flush_log()
+
+    def open_paths():
+        paths = set()
+        for fd in os.listdir("/proc/self/fd"):
+            try:
+                paths.add(os.readlink(f"/proc/self/fd/{fd}"))
+            except OSError:
+                pass
+        return paths
+    assert str(log_file) not in open_paths()
+    assert "line" in log_file.read_text(encoding="utf-8")
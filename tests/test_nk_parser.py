@@ -0,0 +1,123 @@
+import io
+import random
+import re
+
+import pytest
+
+import nuke_copy_reads_nk_parser as nk
+
+
+def _strip_quotes(val):
+    if (val.startswith('"') and val.endswith('"')) or (val.startswith('{') and val.endswith('}')):
+        val = val[1:-1]
+    return val
+
+
+def reference_parse(text):
+    """The original per-line parser, kept as the spec the regex-scan parser must match"""
+    reads = []
+    current = None
+    brace_depth = 0
+
+    re_node_start = re.compile(r'^\s*(Read|DeepRead)\b')
+    re_name = re.compile(r'^\s*name\s+(.+)$')
+    re_file = re.compile(r'^\s*file\s+(.+)$')
+    re_first = re.compile(r'^\s*first\s+(-?\d+)')
+    re_last = re.compile(r'^\s*last\s+(-?\d+)')
+
+    # Universal newlines, as the old open() + readlines() did
+    for line in io.StringIO(text, newline=None).readlines():
+        if current is None:
+            m = re_node_start.match(line)
+            if m:
+                current = nk.ReadEntry()
+                current.node_type = m.group(1)
+                brace_depth = line.count("{") - line.count("}")
+                if brace_depth <= 0:
+                    brace_depth = 1
+            continue
+
+        brace_depth += line.count("{") - line.count("}")
+
+        m = re_name.match(line)
+        if m:
+            current.name = _strip_quotes(m.group(1).strip())
+        m = re_file.match(line)
+        if m:
+            current.file = _strip_quotes(m.group(1).strip())
+        m = re_first.match(line)
+        if m:
+            current.first = int(m.group(1))
+        m = re_last.match(line)
+        if m:
+            current.last = int(m.group(1))
+
+        if brace_depth <= 0:
+            reads.append(current)
+            current = None
+
+    return reads
+
+
+BLOCKS = [
+    'Read {\n inputs 0\n file_type exr\n file "Y:/a/b/plate.%04d.exr"\n format "1920 1080 0 0 1920 1080 1 HD_1080"\n'
+    ' first 1001\n last 1100\n origfirst 1001\n name Read1\n xpos -100\n}\n',
+    ' Read {\n  file {X:/a b/c.####.dpx}\n  first -5\n  last 5\n  name {Read 2}\n }\n',
+    'DeepRead {\n file Y:/deep/d.%03d.exr\n name "DR1"\n first 1\n last 3\n}\n',
+    'Read {\n file "[python nuke.script_directory()]/x.exr"\n name ReadTcl\n}\n',
+    'Group {\n name G1\n}\n Read {\n  file Z:/in/group.exr\n  name InGroup\n }\nend_group\n',
+    'Read { file Y:/oneline.exr name OneLine }\n',
+    'Read {\n file Y:/with/braces.exr\n metadata {{a b} {c d}}\n name Br\n}\n',
+    'ReadGeo2 {\n file Y:/geo.abc\n name Geo\n}\n',
+    'Grade {\n name Grade1\n white {1 1 1 1}\n}\n',
+    'Read {\n file  Y:/spaces.exr   \n first\t7\n last\t9\n name  Sp\n}\n',
+    'Transform {\n translate {{curve x1 0 x2 10} 0}\n center {1024 778}\n name T1\n}\n',
+    'Read {\n name EmptyFile\n}\n',
+    'Read {\r\n file Y:/crlf.####.exr\r\n first 1\r\n last 2\r\n name CRLF\r\n}\r\n',
+    'Read {\r file Y:/cr.exr\r name CR\r}\r',
+    '\t  \n\tRead {\n\tfile Y:/tab.exr\n\tname Tab\n\t}\n',
+    'Read {\n file Y:/odd.exr\n x }{\n name Odd\n}\n',
+    '\x0cRead {\n file Y:/ff.exr\n}\n',
+    'Reader {\n file Y:/no.exr\n}\n',
+    'XDeepRead {\n file Y:/x.exr\n}\n Deep Read {\n file Y:/y.exr\n}\n  ReadRead {\n}\n label "Read it" \n  DeepRead2 {\n}\n',
+    ' name orphan\n file Y:/orphan.exr\n',
+    'Read {\n name\n  file Y:/novalue.exr\n last 4\n}\n',
+    'Read {\n \x0bfile Y:/vt.exr\n  first 3 extra\n name a } {\n name b\n}\n',
+    'Read {\n file Y:/a.exr\n file\n  name z}\n',
+    'Read {\n\n\n   \n file Y:/blank.exr\n}}\n name after\n',
+]
+UNCLOSED = 'Read {\n file Y:/unclosed.exr\n name Unclosed\n'
+
+
+def _fields(reads):
+    return [(r.node_type, r.name, r.file, r.first, r.last) for r in reads]
+
+
+def _parse(tmp_path, text):
+    path = tmp_path / "script.nk"
+    path.write_bytes(text.encode("utf-8"))
+    return nk.parse_nk_for_reads(str(path))
+
+
+def test_parse_read_fields(tmp_path):
+    reads = _parse(tmp_path, BLOCKS[0] + BLOCKS[1] + BLOCKS[2])
+    assert _fields(reads) == [
+        ("Read", "Read1", "Y:/a/b/plate.%04d.exr", 1001, 1100),
+        ("Read", "Read 2", "X:/a b/c.####.dpx", -5, 5),
+        ("DeepRead", "DR1", "Y:/deep/d.%03d.exr", 1, 3),
+    ]
+
+
+def test_parse_skips_other_nodes_and_unclosed(tmp_path):
+    reads = _parse(tmp_path, BLOCKS[7] + BLOCKS[8] + BLOCKS[17] + UNCLOSED)
+    assert reads == []
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_parse_matches_line_parser(tmp_path, seed):
+    rng = random.Random(seed)
+    for trial in range(30):
+        text = "".join(rng.choice(BLOCKS) for _ in range(rng.randint(1, 30)))
+        if trial % 3 == 0:
+            text += UNCLOSED
+        assert _fields(_parse(tmp_path, text)) == _fields(reference_parse(text)), text
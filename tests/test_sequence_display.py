@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import vy_oneCopyShots_gui_v2 as gui
+
+fmt = gui.NukeCopyTab.format_sequence_display
+
+
+def reference_display(path, first, last):
+    """format_sequence_display before the frame_pattern fast path"""
+    if not path:
+        return ""
+    display_path = path
+    if "#" in display_path and "%" not in display_path:
+        match = gui._HASH_RE.search(display_path)
+        if match:
+            hashes = match.group()
+            display_path = display_path.replace(hashes, f"%0{len(hashes)}d")
+    if "%" in display_path and first is not None and last is not None:
+        try:
+            start_dir, start_name = os.path.split(display_path % first)
+            start_root, start_ext = os.path.splitext(start_name)
+            end_root = os.path.splitext(os.path.basename(display_path % last))[0]
+            return os.path.join(start_dir, f"{start_root}-{end_root}{start_ext}")
+        except TypeError:
+            return display_path
+    return display_path
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("Y:/sh/plate.####.exr", ("Y:/sh/plate.", 4, ".exr")),
+    ("Y:/sh/plate.%04d.exr", ("Y:/sh/plate.", 4, ".exr")),
+    ("Y:/sh/plate.%d.exr", ("Y:/sh/plate.", 0, ".exr")),
+    ("Y:/sh/plate.#.exr", ("Y:/sh/plate.", 1, ".exr")),
+    ("Y:/sh/still.exr", None),
+    ("Y:/sh/a.####.b.####.exr", None),
+    ("Y:/sh/a.%04d.b.%04d.exr", None),
+    ("Y:/100%/plate.%04d.exr", None),
+    ("Y:/sh/plate.%04d.exr#", None),
+])
+def test_frame_pattern(path, expected):
+    assert gui.frame_pattern(path) == expected
+
+
+PATHS = [
+    "", "Y:/sh/still.exr", "Y:/sh/plate.####.exr", "Y:/sh/plate.#.exr", "Y:/sh/plate.%04d.exr",
+    "Y:/sh/plate.%d.exr", "Y:/sh/plate.%03d", "Y:/sh/a.####.b.####.exr", "Y:/sh/a.%04d.b.%04d.exr",
+    "Y:/100%/plate.%04d.exr", "Y:/sh/plate.%04d.exr#", "Y:/sh/plate.####.%s.exr", "Y:/v.1/plate_####",
+]
+RANGES = [(1001, 1100), (1, 5), (-5, 5), (-100, -1), (0, 12345), (None, 10), (3, None), (None, None)]
+
+
+def _outcome(func, *args):
+    # A literal % that isn't a frame token makes both versions raise; they must raise the same way
+    try:
+        return func(*args)
+    except ValueError as e:
+        return type(e)
+
+
+@pytest.mark.parametrize("path", PATHS)
+@pytest.mark.parametrize("first, last", RANGES)
+def test_format_sequence_display_matches_reference(path, first, last):
+    assert _outcome(fmt, path, first, last) == _outcome(reference_display, path, first, last)
+
+
+def test_format_sequence_display_range():
+    assert fmt("Y:/sh/plate.####.exr", 1001, 1100) == os.path.join("Y:/sh", "plate.1001-plate.1100.exr")
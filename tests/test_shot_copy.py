@@ -0,0 +1,96 @@
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import vy_oneCopyShots_gui_v2 as gui
+
+MTIME_NS = 1_600_000_000_000_000_000
+
+
+@pytest.fixture
+def roots(tmp_path, monkeypatch):
+    monkeypatch.setattr(gui, "get_base_dir", lambda: tmp_path)  # keep the run logs out of the repo
+    src_root = tmp_path / "unsorted"
+    dest_root = tmp_path / "shots"
+    (src_root / "C01" / "sub").mkdir(parents=True)
+    dest_root.mkdir()
+    src = src_root / "C01" / "sub" / "f.txt"
+    src.write_text("source")
+    os.utime(src, ns=(MTIME_NS, MTIME_NS))
+    return src_root, dest_root
+
+
+def _dst(dest_root):
+    return dest_root / "C01" / "Comp" / "AE" / "sub" / "f.txt"
+
+
+def _run(src_root, dest_root, dryrun, overwrite, skip_unchanged):
+    out = []
+    worker = gui.ShotCopyWorker(src_root, dest_root, "Comp/AE", ["C01"], dryrun, overwrite,
+                                threading.Event(), 2, skip_unchanged=skip_unchanged)
+    worker.finished.connect(lambda *args: out.append(args[1:]))
+    worker.run()
+    return out[0]
+
+
+# dest state -> (overwrite, skip_unchanged) -> copied?
+MATRIX = {
+    "missing": {(False, False): True, (False, True): True, (True, False): True, (True, True): True},
+    "unchanged": {(False, False): False, (False, True): False, (True, False): True, (True, True): False},
+    "changed": {(False, False): False, (False, True): False, (True, False): True, (True, True): True},
+}
+
+
+@pytest.mark.parametrize("dryrun", [False, True])
+@pytest.mark.parametrize("overwrite", [False, True])
+@pytest.mark.parametrize("skip_unchanged", [False, True])
+@pytest.mark.parametrize("state", list(MATRIX))
+def test_skip_overwrite_matrix(roots, state, overwrite, skip_unchanged, dryrun):
+    src_root, dest_root = roots
+    dst = _dst(dest_root)
+    if state != "missing":
+        dst.parent.mkdir(parents=True)
+        dst.write_text("source" if state == "unchanged" else "older!!")
+        mtime = MTIME_NS if state == "unchanged" else MTIME_NS - 60 * 10 ** 9
+        os.utime(dst, ns=(mtime, mtime))
+    before = dst.read_text() if dst.exists() else None
+
+    copied = MATRIX[state][(overwrite, skip_unchanged)]
+    assert _run(src_root, dest_root, dryrun, overwrite, skip_unchanged) == ((1, 0, 0) if copied else (0, 1, 0))
+    if copied and not dryrun:
+        assert dst.read_text() == "source"
+        assert os.stat(dst).st_mtime_ns == MTIME_NS
+    else:
+        assert (dst.read_text() if dst.exists() else None) == before
+
+
+def test_copy_error_still_finishes(roots, tmp_path, monkeypatch):
+    src_root, dest_root = roots
+    (tmp_path / "blocked").write_text("")
+    monkeypatch.setattr(gui, "get_base_dir", lambda: tmp_path / "blocked")  # log folder can't be created
+    stop = threading.Event()
+    worker = gui.ShotCopyWorker(src_root, dest_root, "Comp/AE", ["C01"], False, False, stop, 2)
+    out, warnings = [], []
+    worker.finished.connect(lambda *args: out.append(args))
+    worker.warn.connect(warnings.append)
+    worker.run()
+    assert out == [("", 0, 0, 0)]
+    assert warnings and warnings[0].startswith("Copy failed:")
+    assert stop.is_set()
+
+
+def test_retry_error_still_finishes_and_keeps_pairs(tmp_path, monkeypatch):
+    (tmp_path / "blocked").write_text("")
+    monkeypatch.setattr(gui, "get_base_dir", lambda: tmp_path / "blocked")
+    pairs = [(str(tmp_path / "a"), str(tmp_path / "b"))]
+    worker = gui.RetryCopyWorker(pairs, threading.Event(), 2)
+    out, kept = [], []
+    worker.finished.connect(lambda *args: out.append(args))
+    worker.failures_ready.connect(kept.append)
+    worker.run()
+    assert out == [("", 0, 0, 1)]
+    assert kept == [pairs]
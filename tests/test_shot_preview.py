@@ -0,0 +1,45 @@
+import os
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtWidgets
+
+import vy_oneCopyShots_gui_v2 as gui
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_preview_counts_files_off_the_gui_thread(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(gui, "load_config", lambda: {})
+    for shot in ("C01", "C02"):
+        for sub in ("", "a"):
+            d = tmp_path / "s" / shot / sub
+            d.mkdir(parents=True, exist_ok=True)
+            for k in range(3):
+                (d / str(k)).touch()
+    (tmp_path / "d").mkdir()
+
+    tab = gui.ShotCopyTab()
+    tab.edit_source.setText(str(tmp_path / "s"))
+    tab.edit_dest.setText(str(tmp_path / "d"))
+    tab.edit_subpath.setText("Comp/AE")
+    tab._refresh_list()
+    for i in range(tab.list_shots.count()):
+        tab.list_shots.item(i).setSelected(True)
+
+    tab._preview()
+    # Rows are there immediately; the counts arrive from the worker thread
+    assert tab.table_preview.rowCount() == 2
+    deadline = time.monotonic() + 10
+    while tab._preview_counting and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    assert tab.label_status.text() == "Preview ready: 2 shot(s), 12 file(s)"
+    assert [tab.table_preview.item(r, 1).text() for r in range(2)] == ["6", "6"]
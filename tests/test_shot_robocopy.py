@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import vy_oneCopyShots_gui_v2 as gui
+
+
+@pytest.fixture
+def fake_robocopy(monkeypatch):
+    """Stand-in for robocopy: records its argv and runs for `duration` seconds"""
+    calls = []
+    duration = {"s": 0.0}
+    real_popen = subprocess.Popen
+
+    def popen(args, **kwargs):
+        calls.append(args)
+        kwargs.pop("creationflags", None)
+        script = f"import time; print('summary'); time.sleep({duration['s']})"
+        return real_popen([sys.executable, "-c", script], **kwargs)
+    monkeypatch.setattr(gui.subprocess, "Popen", popen)
+    monkeypatch.setattr(gui.subprocess, "CREATE_NO_WINDOW", 0, raising=False)
+    return calls, duration
+
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    monkeypatch.setattr(gui, "get_base_dir", lambda: tmp_path)
+    for shot in ("C01", "C02"):
+        (tmp_path / "src" / shot).mkdir(parents=True)
+    stop = threading.Event()
+    w = gui.ShotCopyWorker(tmp_path / "src", tmp_path / "dst", "Comp", ["C01", "C02"], False, False,
+                           stop, 6, use_robocopy=True)
+    out = []
+    w.finished.connect(lambda *args: out.append(args[1:]))
+    return w, stop, out, tmp_path / "run.log"
+
+
+def test_mt_follows_workers(fake_robocopy, worker):
+    calls, _ = fake_robocopy
+    w, _, out, log = worker
+    w._run_robocopy(log)
+    assert out == [(2, 0, 0)]
+    assert all("/MT:6" in args for args in calls)
+    assert "summary" in log.read_text(encoding="utf-8")
+
+
+def test_stop_terminates_the_running_robocopy(fake_robocopy, worker):
+    calls, duration = fake_robocopy
+    duration["s"] = 60
+    w, stop, out, log = worker
+    threading.Timer(0.3, stop.set).start()
+    start = time.monotonic()
+    w._run_robocopy(log)
+    assert time.monotonic() - start < 10
+    assert out == [(0, 1, 0)]
+    assert len(calls) == 1  # the second shot is never started
@@ -0,0 +1,20 @@
+import os
+
+import pytest
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtWidgets
+
+import vy_oneCopyShots_gui_v2 as gui
+
+
+def test_finished_box_does_not_block_the_app():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    parent = QtWidgets.QWidget()
+    gui.show_finished(parent, "Done.", "/tmp/copy.log")
+    box = parent.findChild(QtWidgets.QMessageBox)
+    assert box.isVisible() and not box.isModal()
+    assert app.activeModalWidget() is None
+    box.close()
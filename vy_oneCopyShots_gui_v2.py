@@ -16,18 +16,70 @@ import re
 import sys
 import time
 import datetime
-import shutil
+import functools
+import json
+import queue
 import threading
 import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, List, Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PySide6 import QtCore, QtWidgets
 
 import nuke_copy_reads_nk_parser as nk
 
-CXX_RE = re.compile(r"^C\d{2}$", re.IGNORECASE)
+# The shot copy's result loop wakes at least every PROGRESS_INTERVAL seconds to publish its counters
+# and notice Stop, even while no copy has finished
+PROGRESS_INTERVAL = 0.033
+
+# Both tabs poll their worker's counters on a timer (~30 Hz) instead of receiving a signal per file,
+# so big jobs of fast small copies don't flood the GUI event queue
+PROGRESS_POLL_MS = 33
+
+
+def _env_workers(name: str):
+    # Positive int from the environment, clamped to the Workers spin box range; None if unset or invalid
+    try:
+        return min(64, max(1, int(os.environ[name])))
+    except (KeyError, ValueError):
+        return None
+
+
+# Default parallel copies for the shot tab (I/O bound, so more than the core count);
+# COPY_WORKERS in the environment overrides it, e.g. for high-latency SMB shares
+SHOT_COPY_WORKERS = _env_workers("COPY_WORKERS") or min(16, (os.cpu_count() or 4) * 2)
+
+# Shot copy log lines are collected and handed to the (1 MiB buffered) log file in batches of this many
+LOG_BATCH = 1024
+
+# Shot copy scan: shots walked in parallel (directory listing is round-trip bound on a share)
+SHOT_SCAN_WORKERS = 4
+
+# Shot copy streaming: scanned folder batches waiting for a copy thread. A batch is the files of one
+# source folder (at most DIR_BATCH_MAX, so a long frame sequence still spreads over several threads)
+TASK_QUEUE_SIZE = 256
+DIR_BATCH_MAX = 256
+
+# "Use processes": copy processes; each folder batch is one round-trip to a process (amortises pickling/IPC)
+SHOT_COPY_PROCESSES = 4
+
+# Hand the scan's file size to the copy (only the Windows native copy needs it, and only there is
+# DirEntry.stat() free: the size comes with the directory listing, no extra stat per file)
+SIZE_FROM_LISTING = sys.platform == "win32"
+
+# robocopy exit codes 0..7 mean success (bit flags: copied / extra / mismatched)
+ROBOCOPY_OK_MAX = 7
+
+# How often a running robocopy checks for Stop
+ROBOCOPY_POLL_S = 0.2
+
+
+@functools.lru_cache(maxsize=64)
+def norm_path(text: str) -> str:
+    # Path fields are re-normalised on every Refresh/Preview/Copy click; same text, same answer
+    return os.path.normpath(text.strip())
 
 
 def now_stamp():
@@ -38,129 +90,769 @@ def human_time():
     return time.strftime("%Y-%m-%d %H:%M:%S")
 
 
-def is_cxx_dir(p: Path) -> bool:
-    return p.is_dir() and CXX_RE.match(p.name) is not None
+_DIGITS = "0123456789"
 
+# Nuke #### / %0Nd frame token in a Read path
+_HASH_RE = re.compile(r"#+")
+_PRINTF_FRAME_RE = re.compile(r"%0(\d+)d|%d")
 
-def scan_cxx_folders(source_root: Path):
-    if not source_root.exists():
-        return []
-    items = [p.name.upper() for p in source_root.iterdir() if is_cxx_dir(p)]
-    items.sort(key=lambda s: int(s[1:]))  # C01..C99
-    return items
+
+@functools.lru_cache(maxsize=4096)  # bounded like the other caches; a big script has a few thousand Reads
+def frame_pattern(path: str):
+    """(prefix, pad, suffix) for a path with a single frame token, parsed once per distinct path; None otherwise"""
+    if "%" in path:
+        m = _PRINTF_FRAME_RE.search(path)
+        pad = int(m.group(1) or 0) if m else 0
+    else:
+        m = _HASH_RE.search(path)
+        pad = len(m.group()) if m else 0
+    if not m:
+        return None
+    prefix, suffix = path[:m.start()], path[m.end():]
+    if "%" in prefix or "%" in suffix or "#" in suffix:
+        return None  # several tokens / literal %: leave it to the generic formatting
+    return prefix, pad, suffix
 
 
-def iter_files(root: Path):
-    for p in root.rglob("*"):
-        if p.is_file():
-            yield p
+def is_cxx_name(name: str) -> bool:
+    # Same as ^C\d{2}$ (case-insensitive, ASCII digits) without going through re
+    return len(name) == 3 and name[0] in "Cc" and name[1] in _DIGITS and name[2] in _DIGITS
 
 
-def ensure_dir(p: Path):
-    p.mkdir(parents=True, exist_ok=True)
+@functools.lru_cache(maxsize=16)
+def _scan_cxx_cached(root: str, mtime_ns: int) -> tuple:
+    # mtime_ns is only part of the key: adding/removing/renaming a shot folder bumps the root's mtime
+    try:
+        with os.scandir(root) as it:
+            items = [e.name.upper() for e in it if is_cxx_name(e.name) and e.is_dir()]
+    except OSError:
+        return ()
+    items.sort(key=lambda s: int(s[1:]))  # C01..C99
+    return tuple(items)
+
+
+def scan_cxx_folders(source_root: Path):
+    # Refresh on an unchanged root costs one stat instead of a full listing over the network
+    try:
+        st = os.stat(source_root)
+    except OSError:
+        return []
+    return list(_scan_cxx_cached(str(source_root), st.st_mtime_ns))
+
+
+def walk_files(root: str):
+    # os.walk-shaped scandir walk: yields (dir_path, [file DirEntry, ...]) once per folder that has
+    # files. is_file()/is_dir() come from the directory listing, no extra stat per file (only symlinks
+    # need one). Same set as rglob("*") + is_file(): file links are followed, directory links are not
+    # descended into. A caller that needs size/mtime gets it from entry.stat() (free on Windows,
+    # cached after one call elsewhere)
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue
+        files = []
+        with it:
+            for entry in it:
+                if entry.is_file():
+                    files.append(entry)
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+        if files:
+            yield d, files
+
+
+def count_files(root: str) -> int:
+    # Same files as walk_files, but only counted: no DirEntry lists or path strings are kept
+    n = 0
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_file():
+                    n += 1
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return n
+
+
+def make_dir(p: str) -> bool:
+    """Create p (and missing parents); True if it was newly created, False if it already existed"""
+    try:
+        os.mkdir(p)  # common case: parent exists, one syscall
+    except FileExistsError:
+        return False
+    except FileNotFoundError:
+        os.makedirs(p, exist_ok=True)
+    return True
+
+
+def list_names(dir_path: str) -> set:
+    # One scandir per folder instead of one stat per file; normcase to match Windows lookups
+    try:
+        with os.scandir(dir_path) as it:
+            return {os.path.normcase(e.name) for e in it}
+    except OSError:
+        return set()
+
+
+def list_entries(dir_path: str) -> dict:
+    # Like list_names, but keeps the DirEntry so a matching file can be stat-ed only when it is needed
+    try:
+        with os.scandir(dir_path) as it:
+            return {os.path.normcase(e.name): e for e in it}
+    except OSError:
+        return {}
+
+
+def is_unchanged(src_entry: os.DirEntry, dst_entry: os.DirEntry) -> bool:
+    # Same size and mtime within 2 s (FAT/exFAT timestamp granularity); copies keep the source mtime
+    try:
+        s = src_entry.stat()
+        d = dst_entry.stat()
+    except OSError:
+        return False
+    return s.st_size == d.st_size and abs(s.st_mtime_ns - d.st_mtime_ns) < 2_000_000_000
+
+
+def copy_one(src: str, dst: str, skip: Optional[str], dryrun: bool, unbuffered: bool = False,
+             stop_event=None, size: Optional[int] = None):
+    """Copy a single file (dst folder must already exist); returns (tag, src, dst, error) for the log.
+    skip is None or the SKIP_* tag decided at scan time; a large file stops mid-copy once stop_event is set
+    (on Windows only with unbuffered, otherwise Stop takes effect between files).
+    size is the scan's DirEntry size, if known, so the copy doesn't stat the source again"""
+    try:
+        if skip:
+            return skip, src, dst, None
+        if not dryrun:
+            nk.fast_copy(src, dst, unbuffered, stop_event, size)  # CopyFile2 on Windows
+        return ("OK_DRYRUN" if dryrun else "OK"), src, dst, None
+    except InterruptedError:
+        return "CANCELLED", src, dst, 1  # partial file already removed by fast_copy
+    except Exception as e:
+        return "FAIL", src, dst, e
+
+
+# Stop flag of a copy process: the worker's threading.Event can't cross the process boundary,
+# so the pool hands each process a multiprocessing.Event through its initializer
+_process_stop = None
+
+
+def _init_copy_process(stop):
+    global _process_stop
+    _process_stop = stop
+
+
+def copy_many(items: list, dryrun: bool, unbuffered: bool = False) -> list:
+    """copy_one over a chunk of (src, dst, skip, size); module level so a process pool can pickle it"""
+    results = []
+    for i, (src, dst, skip, size) in enumerate(items):
+        if _process_stop is not None and _process_stop.is_set():
+            results.append(("CANCELLED", None, None, len(items) - i))
+            break
+        results.append(copy_one(src, dst, skip, dryrun, unbuffered, _process_stop, size))
+    return results
+
+
+def shell_open(p: str):
+    # Windows: ShellExecuteW via os.startfile, no explorer.exe process spawned per click
+    if sys.platform == "win32":
+        os.startfile(p)
+    elif sys.platform == "darwin":
+        subprocess.Popen(["open", p])
+    else:
+        subprocess.Popen(["xdg-open", p])
 
 
 def open_in_explorer(path_str: str):
     p = path_str.strip()
     if not p:
         return False
-    if os.path.isdir(p) or os.path.isfile(p):
-        subprocess.Popen(["explorer", p])
+    if os.path.exists(p):
+        shell_open(p)
         return True
     return False
 
 
+def show_finished(parent, text: str, log_path: str):
+    # Non-modal: no nested event loop, the tab is usable again right away; the log path goes in the
+    # detailed text, which is only laid out if the user expands it
+    box = QtWidgets.QMessageBox(parent)
+    box.setIcon(QtWidgets.QMessageBox.Information)
+    box.setWindowTitle("Finished")
+    box.setText(text)
+    box.setDetailedText(f"Log:\n{log_path}")
+    box.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+    box.setWindowModality(QtCore.Qt.NonModal)  # a parented QMessageBox is application-modal by default
+    box.show()
+
+
 def get_base_dir() -> Path:
     # base folder: .py -> script folder; .exe -> exe folder
     return Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(__file__).parent
 
 
+def load_config() -> dict:
+    # Small JSON next to the script/exe (like the log folder); missing or broken -> defaults
+    try:
+        with open(get_base_dir() / "config.json", encoding="utf-8") as f:
+            cfg = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cfg if isinstance(cfg, dict) else {}
+
+
+def save_config(**values):
+    cfg = load_config()
+    cfg.update(values)
+    try:
+        with open(get_base_dir() / "config.json", "w", encoding="utf-8") as f:
+            json.dump(cfg, f, indent=2)
+    except OSError:
+        pass  # read-only install folder: just don't remember
+
+
 class ShotCopyWorker(QtCore.QObject):
-    progress = QtCore.Signal(int, int)
     status = QtCore.Signal(str)
     finished = QtCore.Signal(str, int, int, int)
     warn = QtCore.Signal(str)
+    failures_ready = QtCore.Signal(list)  # [(src, dst), ...] that failed, sent once before finished
 
     def __init__(self, src_root: Path, dest_root: Path, subpath: str, shots: List[str],
-                 dryrun: bool, overwrite: bool, stop_event: threading.Event):
+                 dryrun: bool, overwrite: bool, stop_event: threading.Event,
+                 max_workers: int = SHOT_COPY_WORKERS, unbuffered: bool = False,
+                 use_robocopy: bool = False, use_processes: bool = False, skip_unchanged: bool = False,
+                 deep_dryrun: bool = True):
         super().__init__()
         self.src_root = src_root
         self.dest_root = dest_root
-        self.subpath = subpath
-        self.shots = shots
+        # Subpath is typed as Comp\AE or Comp/AE; normalise once to this OS's separator so the
+        # per-shot destination prefix is a single plain string
+        self.subpath = os.path.join(*re.split(r"[\\/]+", subpath.strip("\\/")))
+        # Every source file lives under exactly one shot folder, so a repeated shot is the only way
+        # the same file gets planned twice (e.g. c01 and C01 both listed as "C01" on a case-sensitive share).
+        # Identical content under different shots is deliberately copied once per shot: spotting it would
+        # mean hashing every source file, which costs more reads than the copy it saves
+        self.shots = list(dict.fromkeys(s.upper() for s in shots))
         self.dryrun = dryrun
         self.overwrite = overwrite
         self.stop_event = stop_event
+        self.max_workers = max_workers
+        self.unbuffered = unbuffered
+        self.use_robocopy = use_robocopy
+        self.use_processes = use_processes
+        # Only matters with overwrite on: without it every existing file is skipped anyway
+        self.skip_unchanged = skip_unchanged and overwrite
+        self.deep_dryrun = deep_dryrun
+        # [done, total, found] - written by the worker, polled by the tab's timer (total 0 = still
+        # scanning, found = files scanned so far); plain list item writes are atomic under the GIL,
+        # so no signal per update
+        self.counts = [0, 0, 0]
 
     def run(self):
+        self.log_path = ""
+        self._pool = None
+        try:
+            self._run()
+        except Exception as e:
+            # Still emit finished so the tab stops its poll timer, quits the thread and re-enables Copy;
+            # Stop winds down the scan / copy threads that are still running
+            self.stop_event.set()
+            self.warn.emit(f"Copy failed: {e}")
+            self.finished.emit(self.log_path, 0, 0, 0)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+
+    def _run(self):
         base_dir = get_base_dir()
         log_dir = base_dir / "log"
         log_dir.mkdir(parents=True, exist_ok=True)
         log_path = log_dir / f"backup_unsorted_to_shots_{now_stamp()}.log"
+        self.log_path = str(log_path)
 
-        tasks = []
-        for shot in self.shots:
-            sdir = self.src_root / shot
-            if not sdir.exists():
-                continue
-            for f in iter_files(sdir):
-                rel = f.relative_to(sdir)
-                dst = self.dest_root / shot / self.subpath / rel
-                tasks.append((f, dst))
-
-        total = len(tasks)
-        if total == 0:
-            self.warn.emit("No files found under selected shots.")
-            self.finished.emit(str(log_path), 0, 0, 0)
+        if self.use_robocopy and sys.platform == "win32" and not self.dryrun:
+            self._run_robocopy(log_path)
+            return
+        if self.dryrun and not self.deep_dryrun:
+            self._run_shot_dryrun(log_path)
             return
 
-        self.progress.emit(0, total)
-        self.status.emit(f"Planned {total} file(s)")
+        # Scan thread -> task queue -> copy threads -> one completion queue drained here.
+        # Copying starts while the scan is still running, memory stays O(queue) rather than O(files),
+        # and there is no Future object or wait() set per file: the completion queue is the only rendezvous
+        task_q = queue.Queue(maxsize=TASK_QUEUE_SIZE)
+        done_q = queue.Queue()
+        scanned = {"total": None}
+        src_root = str(self.src_root)
+        dest_root = str(self.dest_root)
+        n_workers = max(1, self.max_workers)
+        # Processes: each copy thread just feeds chunks to the pool and waits, so per-file Python work
+        # (path handling, exceptions, metadata calls) runs outside this process's GIL
+        pool = None
+        if self.use_processes and not self.dryrun:
+            process_stop = multiprocessing.Event()
+            pool = self._pool = ProcessPoolExecutor(SHOT_COPY_PROCESSES, initializer=_init_copy_process,
+                                                    initargs=(process_stop,))
+
+        # Shots are walked by up to SHOT_SCAN_WORKERS threads at once, so the directory listing
+        # round-trips of several shots overlap on the share; found[k] is scan thread k's file count
+        shot_q = queue.SimpleQueue()
+        for shot in self.shots:
+            shot_q.put(shot)
+        n_scanners = max(1, min(SHOT_SCAN_WORKERS, len(self.shots)))
+        found = [0] * n_scanners
+
+        def scan_shot(k, shot):
+            sdir = os.path.join(src_root, shot)
+            if not os.path.isdir(sdir):
+                return
+            src_prefix_len = len(os.path.join(sdir, ""))
+            dst_shot = os.path.join(dest_root, shot, self.subpath)
+            # walk_files hands over one source folder at a time, so its destination folder is
+            # built, created and (for the skip checks) listed once, and each file is one concat;
+            # the folder's files are queued together so one thread copies them in order
+            for dir_path, entries in walk_files(sdir):
+                if self.stop_event.is_set():
+                    return
+                rel = dir_path[src_prefix_len:]
+                parent = os.path.join(dst_shot, rel) if rel else dst_shot
+                created = False
+                if not self.dryrun:
+                    try:
+                        created = make_dir(parent)
+                    except Exception as e:
+                        done_q.put(("FAIL_DIR", parent, None, e))
+                # A folder we just created is empty: no need to list it
+                if created or (self.overwrite and not self.skip_unchanged):
+                    names = None
+                elif self.skip_unchanged:
+                    names = list_entries(parent)
+                else:
+                    names = list_names(parent)
+                dst_prefix = os.path.join(parent, "")
+                batch = []
+                for entry in entries:
+                    name = entry.name
+                    skip = None
+                    if names:
+                        key = os.path.normcase(name)
+                        if not self.overwrite:
+                            if key in names:
+                                skip = "SKIP_EXISTS"
+                        elif key in names and is_unchanged(entry, names[key]):
+                            skip = "SKIP_UNCHANGED"
+                    size = None
+                    if SIZE_FROM_LISTING and not skip:
+                        try:
+                            size = entry.stat().st_size
+                        except OSError:
+                            pass
+                    batch.append((entry.path, dst_prefix + name, skip, size))
+                    if len(batch) >= DIR_BATCH_MAX:
+                        task_q.put(batch)
+                        batch = []
+                if batch:
+                    task_q.put(batch)
+                found[k] += len(entries)
+                self.counts[2] = sum(found)
+
+        def scan(k):
+            while not self.stop_event.is_set():
+                try:
+                    shot = shot_q.get_nowait()
+                except queue.Empty:
+                    return
+                scan_shot(k, shot)
+
+        def produce():
+            try:
+                scanners = [threading.Thread(target=scan, args=(k,), name=f"shot-scan-{k}", daemon=True)
+                            for k in range(n_scanners)]
+                for t in scanners:
+                    t.start()
+                for t in scanners:
+                    t.join()
+            finally:
+                scanned["total"] = sum(found)
+                for _ in range(n_workers):
+                    task_q.put(None)
+
+        def work():
+            while True:
+                batch = task_q.get()
+                if batch is None:
+                    break
+                for i, (src, dst, skip, size) in enumerate(batch):
+                    if self.stop_event.is_set():
+                        done_q.put(("CANCELLED", None, None, len(batch) - i))
+                        break
+                    done_q.put(copy_one(src, dst, skip, self.dryrun, self.unbuffered, self.stop_event, size))
+            done_q.put(None)
+
+        def work_pool():
+            while True:
+                batch = task_q.get()
+                if batch is None:
+                    break
+                try:
+                    results = pool.submit(copy_many, batch, self.dryrun, self.unbuffered).result()
+                except Exception as e:  # pool broken (e.g. a copy process died)
+                    results = [("FAIL", src, dst, e) for src, dst, _, _ in batch]
+                for r in results:
+                    done_q.put(r)
+            done_q.put(None)
+
+        def cancel_queued():
+            # Stop: drop everything still waiting in the queue (copies already running finish);
+            # end-of-scan markers are put back so every copy thread still exits
+            dropped = 0
+            markers = 0
+            while True:
+                try:
+                    item = task_q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    markers += 1
+                else:
+                    dropped += len(item)
+            for _ in range(markers):
+                task_q.put(None)
+            return dropped
+
+        threading.Thread(target=produce, name="shot-scan", daemon=True).start()
+        for k in range(n_workers):
+            threading.Thread(target=work_pool if pool else work, name=f"shot-copy-{k}", daemon=True).start()
+
+        self.status.emit("Scanning files...")
 
         ok = 0
         skipped = 0
         failed = 0
+        done = 0
+        # Failures are only collected during the run (never prompted for), offered for retry at the end
+        failures = []
 
-        with open(log_path, "w", encoding="utf-8") as log:
+        with open(log_path, "w", encoding="utf-8", buffering=1 << 20) as log:
             log.write(f"[{human_time()}] Start\n")
             log.write(f"Dry-run: {self.dryrun}\nOverwrite: {self.overwrite}\n")
+            log.write(f"Skip unchanged: {self.skip_unchanged}\n")
+            log.write(f"SourceRoot: {self.src_root}\nDestRoot: {self.dest_root}\nSubpath: {self.subpath}\n")
+            log.write(f"Shots: {', '.join(self.shots)}\n")
+            log.write(f"Workers: {self.max_workers}\nUnbuffered large files: {self.unbuffered}\n")
+            log.write(f"Processes: {SHOT_COPY_PROCESSES if pool else 0}\n")
+            log.write("-" * 80 + "\n")
+
+            # Per-file lines are collected and written LOG_BATCH at a time
+            log_buf = []
+
+            def flush_log_buf():
+                log.writelines(log_buf)
+                log_buf.clear()
+
+            # Results (and log writes) are handled here in completion order,
+            # so the log file is only ever written from this thread; the finally makes sure
+            # lines already collected still reach the log if anything below raises
+            workers_left = n_workers
+            stop_logged = False
+            try:
+                while workers_left:
+                    try:
+                        batch = [done_q.get(timeout=PROGRESS_INTERVAL)]
+                    except queue.Empty:
+                        batch = []
+                    while True:
+                        try:
+                            batch.append(done_q.get_nowait())
+                        except queue.Empty:
+                            break
+
+                    for r in batch:
+                        if r is None:
+                            workers_left -= 1
+                            continue
+                        tag, src, dst, err = r
+                        if tag == "FAIL_DIR":
+                            log_buf.append(f"[FAIL_DIR] {src} | {err}\n")
+                            continue
+                        if tag == "CANCELLED":  # stopped mid-copy, or the rest of a folder batch; err is the count
+                            skipped += err
+                            done += err
+                            log_buf.append(f"[CANCELLED] {src} -> {dst}\n" if src
+                                           else f"[CANCELLED] {err} queued file(s) not copied\n")
+                            continue
+                        done += 1
+                        if tag == "SKIP_EXISTS" or tag == "SKIP_UNCHANGED":
+                            skipped += 1
+                            log_buf.append(f"[{tag}] {src} -> {dst}\n")
+                        elif tag == "FAIL":
+                            failed += 1
+                            failures.append((src, dst))
+                            log_buf.append(f"[FAIL] {src} -> {dst} | {err}\n")
+                        else:
+                            ok += 1
+                            log_buf.append(f"[{tag}] {src} -> {dst}\n")
+                    if len(log_buf) >= LOG_BATCH:
+                        flush_log_buf()
+
+                    if self.stop_event.is_set():
+                        if not stop_logged:
+                            log_buf.append(f"[{human_time()}] STOP requested.\n")
+                            stop_logged = True
+                            if pool:
+                                process_stop.set()  # batches already inside a copy process stop too
+                        # The scan thread may still push a few files before it sees the stop
+                        dropped = cancel_queued()
+                        if dropped:
+                            skipped += dropped
+                            done += dropped
+                            log_buf.append(f"[CANCELLED] {dropped} queued file(s) not copied\n")
+
+                    self.counts[0] = done
+                    self.counts[1] = scanned["total"] or 0
+            finally:
+                flush_log_buf()
+            log.write("-" * 80 + "\n")
+            log.write(f"[{human_time()}] End | OK={ok} SKIP={skipped} FAIL={failed}\n")
+
+        if pool:
+            pool.shutdown()
+        if scanned["total"] == 0:
+            self.warn.emit("No files found under selected shots.")
+        self.failures_ready.emit(failures)
+        self.finished.emit(str(log_path), ok, skipped, failed)
+
+    def _run_shot_dryrun(self, log_path: Path):
+        # Quick dry-run: one planned pair per shot, no file walk (a few stats instead of the whole tree)
+        total = len(self.shots)
+        planned = 0
+        missing = 0
+        self.counts[1] = total
+
+        with open(log_path, "w", encoding="utf-8") as log:
+            log.write(f"[{human_time()}] Start (dry-run, shot level)\n")
             log.write(f"SourceRoot: {self.src_root}\nDestRoot: {self.dest_root}\nSubpath: {self.subpath}\n")
             log.write(f"Shots: {', '.join(self.shots)}\n")
             log.write("-" * 80 + "\n")
 
-            for i, (src, dst) in enumerate(tasks, start=1):
+            for i, shot in enumerate(self.shots, start=1):
+                src = os.path.join(str(self.src_root), shot)
+                dst = os.path.join(str(self.dest_root), shot, self.subpath)
+                if not os.path.isdir(src):
+                    missing += 1
+                    log.write(f"[SKIP_NO_SOURCE] {src}\n")
+                else:
+                    planned += 1
+                    note = "exists" if os.path.isdir(dst) else "will be created"
+                    log.write(f"[PLAN] {src} -> {dst} ({note})\n")
+                self.counts[0] = i
+
+            log.write("-" * 80 + "\n")
+            log.write(f"[{human_time()}] End | PLANNED={planned} MISSING={missing} (shots)\n")
+
+        self.finished.emit(str(log_path), planned, missing, 0)  # tab labels these as shots, see _finish_copy
+
+    def _run_robocopy(self, log_path: Path):
+        # One robocopy /MT:<Workers> per shot; OK/SKIP/FAIL counts are per shot, file details are in robocopy's summary
+        flags = ["/E", f"/MT:{max(1, self.max_workers)}", "/R:1", "/W:1", "/NFL", "/NDL", "/NJH", "/NP"]
+        # Skip existing: exclude changed/newer/older files; Overwrite: include same/tweaked files too;
+        # Overwrite + skip unchanged: robocopy's default (copies changed files, skips same ones)
+        if not self.overwrite:
+            flags += ["/XC", "/XN", "/XO"]
+        elif not self.skip_unchanged:
+            flags += ["/IS", "/IT"]
+
+        shots = [s for s in self.shots if os.path.isdir(os.path.join(str(self.src_root), s))]
+        total = len(shots)
+        ok = 0
+        skipped = 0
+        failed = 0
+        self.counts[1] = total
+
+        with open(log_path, "w", encoding="utf-8") as log:
+            log.write(f"[{human_time()}] Start (robocopy)\n")
+            log.write(f"Overwrite: {self.overwrite}\n")
+            log.write(f"SourceRoot: {self.src_root}\nDestRoot: {self.dest_root}\nSubpath: {self.subpath}\n")
+            log.write(f"Shots: {', '.join(self.shots)}\n")
+            log.write(f"Flags: {' '.join(flags)}\n")
+            log.write("-" * 80 + "\n")
+
+            for i, shot in enumerate(shots, start=1):
                 if self.stop_event.is_set():
                     log.write(f"[{human_time()}] STOP requested.\n")
                     break
+                src = os.path.join(str(self.src_root), shot)
+                dst = os.path.join(str(self.dest_root), shot, self.subpath)
+                self.status.emit(f"robocopy {shot} ({i}/{total})")
+                stopped = False
                 try:
-                    if dst.exists() and not self.overwrite:
-                        skipped += 1
-                        log.write(f"[SKIP_EXISTS] {src} -> {dst}\n")
-                    else:
-                        if not self.dryrun:
-                            ensure_dir(dst.parent)
-                            shutil.copy2(src, dst)
-                        ok += 1
-                        log.write(f"[OK{'_DRYRUN' if self.dryrun else ''}] {src} -> {dst}\n")
+                    proc = subprocess.Popen(["robocopy", src, dst] + flags, stdout=subprocess.PIPE,
+                                            stderr=subprocess.STDOUT, text=True, errors="replace",
+                                            creationflags=subprocess.CREATE_NO_WINDOW)
+                    # A shot can take minutes: wait in short slices so Stop ends robocopy instead of
+                    # waiting for it (communicate keeps draining the pipe, robocopy never blocks on it)
+                    while True:
+                        try:
+                            out, _ = proc.communicate(timeout=ROBOCOPY_POLL_S)
+                            break
+                        except subprocess.TimeoutExpired:
+                            if self.stop_event.is_set():
+                                proc.terminate()
+                                out, _ = proc.communicate()
+                                stopped = True
+                                break
+                    code, out = proc.returncode, (out or "").strip()
                 except Exception as e:
+                    code, out = -1, str(e)
+
+                if stopped:
+                    skipped += 1
+                    log.write(f"[CANCELLED] {src} -> {dst} | robocopy stopped\n")
+                elif 0 <= code <= ROBOCOPY_OK_MAX:
+                    ok += 1
+                    log.write(f"[OK] {src} -> {dst} | robocopy exit {code}\n")
+                else:
                     failed += 1
-                    log.write(f"[FAIL] {src} -> {dst} | {e}\n")
-
-                self.progress.emit(i, total)
-                self.status.emit(f"Copying {i}/{total}")
+                    log.write(f"[FAIL] {src} -> {dst} | robocopy exit {code}\n")
+                if out:
+                    log.write(out + "\n")
+                self.counts[0] = i
 
             log.write("-" * 80 + "\n")
-            log.write(f"[{human_time()}] End | OK={ok} SKIP={skipped} FAIL={failed}\n")
+            log.write(f"[{human_time()}] End | OK={ok} SKIP={skipped} FAIL={failed} (shots)\n")
 
         self.finished.emit(str(log_path), ok, skipped, failed)
 
 
+class PreviewCountWorker(QtCore.QObject):
+    """Counts each previewed shot's files off the GUI thread (a full walk per shot, slow on a share)"""
+    counted = QtCore.Signal(int, int, int)  # run id, row, file count
+    finished = QtCore.Signal(int, int)  # run id, total files
+
+    def __init__(self, run_id: int, sources: List[str], stop_event: threading.Event):
+        super().__init__()
+        self.run_id = run_id
+        self.sources = sources
+        self.stop_event = stop_event
+
+    def run(self):
+        total = 0
+        for row, src in enumerate(self.sources):
+            if self.stop_event.is_set():
+                break
+            n = count_files(src)
+            total += n
+            self.counted.emit(self.run_id, row, n)
+        self.finished.emit(self.run_id, total)
+
+
+class RetryCopyWorker(QtCore.QObject):
+    """Retry Failed: copy again just the (src, dst) pairs that failed in the last shot copy, no scan.
+    Only failures are retried; files a stopped run never got to are picked up by running Copy again"""
+    status = QtCore.Signal(str)
+    finished = QtCore.Signal(str, int, int, int)
+    warn = QtCore.Signal(str)
+    failures_ready = QtCore.Signal(list)
+
+    def __init__(self, pairs: List[tuple], stop_event: threading.Event,
+                 max_workers: int = SHOT_COPY_WORKERS, unbuffered: bool = False):
+        super().__init__()
+        self.pairs = list(pairs)
+        self.stop_event = stop_event
+        self.max_workers = max_workers
+        self.unbuffered = unbuffered
+        self.counts = [0, 0, 0]  # [done, total, found], polled by the tab like ShotCopyWorker.counts
+
+    def run(self):
+        self.log_path = ""
+        self._pool = None
+        try:
+            self._run()
+        except Exception as e:
+            # Same guard as ShotCopyWorker.run; the pairs are handed back so Retry stays available
+            self.stop_event.set()
+            self.warn.emit(f"Retry failed: {e}")
+            self.failures_ready.emit(self.pairs)
+            self.finished.emit(self.log_path, 0, 0, len(self.pairs))
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)  # queued copies are dropped, not run after an error
+
+    def _run(self):
+        log_dir = get_base_dir() / "log"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        log_path = log_dir / f"backup_unsorted_to_shots_{now_stamp()}.log"
+        self.log_path = str(log_path)
+        pairs = self.pairs
+        total = len(pairs)
+        self.counts[1] = total
+        ok = 0
+        skipped = 0
+        failures = []
+
+        ex = self._pool = ThreadPoolExecutor(max(1, self.max_workers))
+        with open(log_path, "w", encoding="utf-8", buffering=1 << 20) as log:
+            log.write(f"[{human_time()}] Start (retry {total} failed file(s))\n")
+            log.write(f"Workers: {self.max_workers}\nUnbuffered large files: {self.unbuffered}\n")
+            log.write("-" * 80 + "\n")
+            # A pair may have failed because its folder couldn't be created ([FAIL_DIR]): try again, once per folder
+            for parent in dict.fromkeys(os.path.dirname(dst) for _, dst in pairs):
+                try:
+                    make_dir(parent)
+                except Exception as e:
+                    log.write(f"[FAIL_DIR] {parent} | {e}\n")
+            futures = [ex.submit(copy_one, src, dst, None, False, self.unbuffered, self.stop_event)
+                       for src, dst in pairs]
+            for done, fut in enumerate(as_completed(futures), 1):
+                if self.stop_event.is_set():
+                    for f in futures:
+                        f.cancel()
+                if fut.cancelled():
+                    skipped += 1
+                    log.write("[CANCELLED] queued file not copied\n")
+                else:
+                    tag, src, dst, err = fut.result()
+                    if tag == "OK":
+                        ok += 1
+                        log.write(f"[OK] {src} -> {dst}\n")
+                    elif tag == "CANCELLED":
+                        skipped += 1
+                        log.write(f"[CANCELLED] {src} -> {dst}\n")
+                    else:
+                        failures.append((src, dst))
+                        log.write(f"[FAIL] {src} -> {dst} | {err}\n")
+                self.counts[0] = done
+            log.write("-" * 80 + "\n")
+            log.write(f"[{human_time()}] End | OK={ok} SKIP={skipped} FAIL={len(failures)}\n")
+
+        self.failures_ready.emit(failures)
+        self.finished.emit(str(log_path), ok, skipped, len(failures))
+
+
 class ShotCopyTab(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._stop_event = threading.Event()
         self._thread = None
         self._worker = None
+        self._preview_stop = threading.Event()
+        self._preview_run = 0  # id of the preview count whose results are shown; older runs are ignored
+        self._preview_counting = False
+        self._preview_threads = {}  # run id -> (thread, worker), kept alive until the next Preview finds them done
+        self._counts = [0, 0, 0]
+        self._shown_counts = None
+        self._failed_pairs = []  # (src, dst) that failed in the last run, for Retry Failed
+        self._shot_level = False  # last run was a quick dry-run: counts are shots, not files
+        self._poll_timer = QtCore.QTimer(self)
+        self._poll_timer.setInterval(PROGRESS_POLL_MS)
+        self._poll_timer.timeout.connect(self._poll_progress)
         self._build_ui()
         self._refresh_list()
 
@@ -197,8 +889,38 @@ class ShotCopyTab(QtWidgets.QWidget):
         self.chk_dryrun = QtWidgets.QCheckBox("Dry-run (no actual copy)")
         self.chk_overwrite = QtWidgets.QCheckBox("Overwrite existing files")
         self.chk_dryrun.setChecked(True)
+        self.chk_deep_dryrun = QtWidgets.QCheckBox("Deep dry-run (walk files)")
+        self.chk_deep_dryrun.setChecked(True)
+        self.chk_deep_dryrun.setToolTip("Unchecked: dry-run only checks each shot's source/destination folder, "
+                                        "without listing every file")
+        self.chk_unbuffered = QtWidgets.QCheckBox("Unbuffered copy for large files (Windows)")
+        self.chk_unbuffered.setToolTip(
+            f"Files >= {nk.UNBUFFERED_THRESHOLD >> 20} MiB bypass the Windows file cache (CopyFileExW NO_BUFFERING)")
+        self.chk_robocopy = QtWidgets.QCheckBox("Use robocopy (Windows)")
+        self.chk_robocopy.setToolTip("Copy each shot with robocopy (/MT set from Workers) instead of the built-in copier (ignored in dry-run)")
+        self.chk_robocopy.setEnabled(sys.platform == "win32")
+        self.chk_skip_unchanged = QtWidgets.QCheckBox("Skip unchanged (size+mtime)")
+        self.chk_skip_unchanged.setToolTip("With Overwrite: leave files that already match the source by size and mtime")
+        self.chk_processes = QtWidgets.QCheckBox("Use multiprocessing")
+        self.chk_processes.setToolTip(f"Run the copies in {SHOT_COPY_PROCESSES} worker processes "
+                                      f"(helps with many small files; ignored in dry-run)")
+        # Copy threads = copies in flight (the queue depth): the work is SMB-latency bound, not CPU bound,
+        # so deeper helps on slow links, e.g. 8 on the LAN, 32 over a WAN/VPN
+        self.spin_workers = QtWidgets.QSpinBox()
+        self.spin_workers.setRange(1, 64)
+        self.spin_workers.setToolTip("Copies in flight at once (queue depth). Raise it for high-latency shares, "
+                                     "lower it if the server struggles. Remembered in config.json.")
+        workers = SHOT_COPY_WORKERS if _env_workers("COPY_WORKERS") else load_config().get("shot_workers")
+        self.spin_workers.setValue(workers if isinstance(workers, int) else SHOT_COPY_WORKERS)
         opts_layout.addWidget(self.chk_dryrun)
+        opts_layout.addWidget(self.chk_deep_dryrun)
         opts_layout.addWidget(self.chk_overwrite)
+        opts_layout.addWidget(self.chk_skip_unchanged)
+        opts_layout.addWidget(self.chk_unbuffered)
+        opts_layout.addWidget(self.chk_robocopy)
+        opts_layout.addWidget(self.chk_processes)
+        opts_layout.addWidget(QtWidgets.QLabel("Workers:"))
+        opts_layout.addWidget(self.spin_workers)
         opts_layout.addStretch()
 
         main_split = QtWidgets.QHBoxLayout()
@@ -226,8 +948,8 @@ class ShotCopyTab(QtWidgets.QWidget):
         box_preview = QtWidgets.QGroupBox("Preview / Results (double-click row to open folders)")
         main_split.addWidget(box_preview, 1)
         preview_layout = QtWidgets.QVBoxLayout(box_preview)
-        self.table_preview = QtWidgets.QTableWidget(0, 3)
-        self.table_preview.setHorizontalHeaderLabels(["SHOT", "SOURCE", "DESTINATION"])
+        self.table_preview = QtWidgets.QTableWidget(0, 4)
+        self.table_preview.setHorizontalHeaderLabels(["SHOT", "FILES", "SOURCE", "DESTINATION"])
         self.table_preview.horizontalHeader().setStretchLastSection(True)
         self.table_preview.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table_preview.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
@@ -240,9 +962,14 @@ class ShotCopyTab(QtWidgets.QWidget):
         self.btn_copy = QtWidgets.QPushButton("2) Copy")
         self.btn_stop = QtWidgets.QPushButton("Stop")
         self.btn_stop.setEnabled(False)
+        self.btn_retry = QtWidgets.QPushButton("Retry Failed")
+        self.btn_retry.setEnabled(False)
+        self.btn_retry.setToolTip("Copy again only the files that failed in the last run "
+                                  "(files skipped by Stop are not included: run Copy again for those)")
         self.btn_preview.clicked.connect(self._preview)
         self.btn_copy.clicked.connect(self._copy)
         self.btn_stop.clicked.connect(self._stop)
+        self.btn_retry.clicked.connect(self._retry_failed)
 
         btn_open_source = QtWidgets.QPushButton("Open Source")
         btn_open_dest = QtWidgets.QPushButton("Open Dest")
@@ -255,6 +982,7 @@ class ShotCopyTab(QtWidgets.QWidget):
         box_bottom.addWidget(self.btn_preview)
         box_bottom.addWidget(self.btn_copy)
         box_bottom.addWidget(self.btn_stop)
+        box_bottom.addWidget(self.btn_retry)
         box_bottom.addWidget(btn_open_source)
         box_bottom.addWidget(btn_open_dest)
         box_bottom.addWidget(self.progress, 1)
@@ -296,10 +1024,15 @@ class ShotCopyTab(QtWidgets.QWidget):
         self.list_shots.clearSelection()
 
     def _refresh_list(self):
-        self.list_shots.clear()
-        src = Path(os.path.normpath(self.edit_source.text().strip()))
+        src = Path(norm_path(self.edit_source.text()))
         shots = scan_cxx_folders(src)
-        self.list_shots.addItems(shots)
+        current = [self.list_shots.item(i).text() for i in range(self.list_shots.count())]
+        if current != shots:
+            # Unchanged list keeps its items (and selection); otherwise rebuild with repaints off
+            self.list_shots.setUpdatesEnabled(False)
+            self.list_shots.clear()
+            self.list_shots.addItems(shots)
+            self.list_shots.setUpdatesEnabled(True)
         self.label_status.setText(f"Found {len(shots)} shots in source")
 
     def _get_selected_shots(self):
@@ -307,13 +1040,13 @@ class ShotCopyTab(QtWidgets.QWidget):
 
     def _validate(self):
         try:
-            src_root = Path(os.path.normpath(self.edit_source.text().strip()))
-            dest_root = Path(os.path.normpath(self.edit_dest.text().strip()))
+            src_root = Path(norm_path(self.edit_source.text()))
+            dest_root = Path(norm_path(self.edit_dest.text()))
             subpath = self.edit_subpath.text().strip().strip("\\/")
 
-            if not src_root.exists() or not src_root.is_dir():
+            if not src_root.is_dir():  # False for a missing path too: one stat instead of two
                 raise ValueError(f"Source root not found: {src_root}")
-            if not dest_root.exists() or not dest_root.is_dir():
+            if not dest_root.is_dir():
                 raise ValueError(f"Destination shots root not found: {dest_root}")
             if not subpath:
                 raise ValueError("Destination Subpath is empty (e.g. Comp\\AE)")
@@ -333,16 +1066,55 @@ class ShotCopyTab(QtWidgets.QWidget):
             return
         src_root, dest_root, subpath, shots = v
 
-        self.table_preview.setRowCount(0)
-        for shot in shots:
+        # All rows allocated up front and filled with repaints/sorting off: one layout pass, not one per row
+        table = self.table_preview
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.setRowCount(0)
+        table.setRowCount(len(shots))
+        sources = []
+        for row, shot in enumerate(shots):
             src = src_root / shot
             dst = dest_root / shot / subpath
-            row = self.table_preview.rowCount()
-            self.table_preview.insertRow(row)
-            self.table_preview.setItem(row, 0, QtWidgets.QTableWidgetItem(shot))
-            self.table_preview.setItem(row, 1, QtWidgets.QTableWidgetItem(str(src)))
-            self.table_preview.setItem(row, 2, QtWidgets.QTableWidgetItem(str(dst)))
-        self.label_status.setText(f"Preview ready: {len(shots)} shot(s)")
+            sources.append(str(src))
+            table.setItem(row, 0, QtWidgets.QTableWidgetItem(shot))
+            table.setItem(row, 1, QtWidgets.QTableWidgetItem("..."))
+            table.setItem(row, 2, QtWidgets.QTableWidgetItem(str(src)))
+            table.setItem(row, 3, QtWidgets.QTableWidgetItem(str(dst)))
+        table.setUpdatesEnabled(True)
+        self.label_status.setText(f"Preview: {len(shots)} shot(s), counting files...")
+        self._start_preview_count(sources)
+
+    def _start_preview_count(self, sources: List[str]):
+        # The rows are shown right away; FILES is filled in per shot as a worker thread walks each tree
+        self._preview_stop.set()  # a previous count still running: its results are ignored from here on
+        self._preview_stop = threading.Event()
+        for run_id, (old_thread, _) in list(self._preview_threads.items()):
+            if old_thread.isFinished():
+                del self._preview_threads[run_id]  # drops the worker; the thread goes with deleteLater
+                old_thread.deleteLater()
+        self._preview_run += 1
+        self._preview_counting = True
+        thread = QtCore.QThread(self)
+        worker = PreviewCountWorker(self._preview_run, sources, self._preview_stop)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.counted.connect(self._preview_counted)
+        worker.finished.connect(self._preview_count_done)
+        worker.finished.connect(thread.quit)
+        self._preview_threads[self._preview_run] = (thread, worker)
+        thread.start()
+
+    def _preview_counted(self, run_id: int, row: int, n: int):
+        if run_id == self._preview_run:
+            self.table_preview.setItem(row, 1, QtWidgets.QTableWidgetItem(str(n)))
+
+    def _preview_count_done(self, run_id: int, total: int):
+        if run_id != self._preview_run:
+            return
+        self._preview_counting = False
+        if not self._preview_stop.is_set():
+            self.label_status.setText(f"Preview ready: {self.table_preview.rowCount()} shot(s), {total} file(s)")
 
     def _stop(self):
         self._stop_event.set()
@@ -359,15 +1131,13 @@ class ShotCopyTab(QtWidgets.QWidget):
             QtWidgets.QMessageBox.warning(self, "Open Dest", f"Folder not found:\n{p}")
 
     def _open_preview_row(self, row, _column):
-        src = self.table_preview.item(row, 1).text() if self.table_preview.item(row, 1) else ""
-        dst = self.table_preview.item(row, 2).text() if self.table_preview.item(row, 2) else ""
+        src = self.table_preview.item(row, 2).text() if self.table_preview.item(row, 2) else ""
+        dst = self.table_preview.item(row, 3).text() if self.table_preview.item(row, 3) else ""
         opened_any = False
-        if os.path.isdir(src):
-            subprocess.Popen(["explorer", src])
-            opened_any = True
-        if os.path.isdir(dst):
-            subprocess.Popen(["explorer", dst])
-            opened_any = True
+        for p in (src, dst):
+            if os.path.isdir(p):
+                shell_open(p)
+                opened_any = True
         if not opened_any:
             QtWidgets.QMessageBox.warning(self, "Open folders", f"Folders not found:\n{src}\n{dst}")
 
@@ -378,7 +1148,7 @@ class ShotCopyTab(QtWidgets.QWidget):
             return
 
         try:
-            path = Path(os.path.normpath(p))
+            path = Path(norm_path(p))
             if path.exists():
                 QtWidgets.QMessageBox.information(self, "Create Folder", f"Folder already exists:\n{path}")
                 return
@@ -406,14 +1176,15 @@ class ShotCopyTab(QtWidgets.QWidget):
         failed = 0
         errs = []
 
+        # make_dir: one mkdir when the shot folder exists (no exists() stat first); makedirs only
+        # for the missing parents of a new shot folder. Shots are unique, so each folder is tried once
+        root = str(dest_root)
         for shot in shots:
             try:
-                dst_dir = dest_root / shot / subpath
-                if dst_dir.exists():
-                    existed += 1
-                else:
-                    dst_dir.mkdir(parents=True, exist_ok=True)
+                if make_dir(os.path.join(root, shot, subpath)):
                     created += 1
+                else:
+                    existed += 1
             except Exception as e:
                 failed += 1
                 errs.append(f"{shot}: {e}")
@@ -433,70 +1204,145 @@ class ShotCopyTab(QtWidgets.QWidget):
 
         dryrun = self.chk_dryrun.isChecked()
         overwrite = self.chk_overwrite.isChecked()
+        max_workers = int(self.spin_workers.value())
+        if max_workers != load_config().get("shot_workers", SHOT_COPY_WORKERS):
+            save_config(shot_workers=max_workers)
+        unbuffered = self.chk_unbuffered.isChecked()
+        use_robocopy = self.chk_robocopy.isChecked()
+        use_processes = self.chk_processes.isChecked()
+        skip_unchanged = self.chk_skip_unchanged.isChecked()
+        deep_dryrun = self.chk_deep_dryrun.isChecked()
+
+        self._start_worker(ShotCopyWorker(src_root, dest_root, subpath, shots, dryrun, overwrite,
+                                          self._stop_event, max_workers, unbuffered, use_robocopy,
+                                          use_processes, skip_unchanged, deep_dryrun))
+
+    def _retry_failed(self):
+        if not self._failed_pairs:
+            return
+        self._start_worker(RetryCopyWorker(self._failed_pairs, self._stop_event,
+                                           int(self.spin_workers.value()), self.chk_unbuffered.isChecked()))
 
+    def _start_worker(self, worker: QtCore.QObject):
+        self._preview_stop.set()  # don't walk the shots for the preview while they are being copied
         self._stop_event.clear()
+        self._set_failed_pairs([])  # robocopy / quick dry-run report no pairs: don't keep stale ones
+        self._shot_level = isinstance(worker, ShotCopyWorker) and worker.dryrun and not worker.deep_dryrun
         self.btn_stop.setEnabled(True)
         self.btn_preview.setEnabled(False)
         self.btn_copy.setEnabled(False)
+        self.btn_retry.setEnabled(False)
 
         self._thread = QtCore.QThread(self)
-        self._worker = ShotCopyWorker(src_root, dest_root, subpath, shots, dryrun, overwrite, self._stop_event)
+        self._worker = worker
         self._worker.moveToThread(self._thread)
         self._thread.started.connect(self._worker.run)
-        self._worker.progress.connect(self._update_progress)
+        self._counts = self._worker.counts
+        self._shown_counts = None
         self._worker.status.connect(self.label_status.setText)
         self._worker.warn.connect(self._show_warning)
+        self._worker.failures_ready.connect(self._set_failed_pairs)
         self._worker.finished.connect(self._finish_copy)
         self._worker.finished.connect(self._thread.quit)
         self._worker.finished.connect(self._worker.deleteLater)
         self._thread.finished.connect(self._thread.deleteLater)
+        self.progress.setMaximum(0)  # busy bar until the scan reports a total
+        self._poll_timer.start()
         self._thread.start()
 
+    def _set_failed_pairs(self, pairs: list):
+        self._failed_pairs = pairs
+        self.btn_retry.setText(f"Retry Failed ({len(pairs)})" if pairs else "Retry Failed")
+
     def _show_warning(self, msg: str):
         QtWidgets.QMessageBox.warning(self, "Warning", msg)
 
-    def _update_progress(self, i: int, total: int):
-        self.progress.setMaximum(total)
+    def _poll_progress(self):
+        counts = tuple(self._counts)
+        if counts != self._shown_counts:
+            self._shown_counts = counts
+            self._update_progress(*counts)
+
+    def _update_progress(self, i: int, total: int, found: int = 0):
+        # Status text is built here from the counters, so the worker never formats or posts it
+        if self.progress.maximum() != total:  # total only changes once, when the scan finishes
+            self.progress.setMaximum(total)
         self.progress.setValue(i)
+        if total:
+            self.label_status.setText(f"Copying {i}/{total}")
+        elif i or found:
+            self.label_status.setText(f"Copying {i}/{found}+ (scanning...)")
 
     def _finish_copy(self, log_path: str, ok: int, skipped: int, failed: int):
+        self._poll_timer.stop()
+        self._poll_progress()
+        # Leave busy mode even if nothing was found (total stayed 0) or the run stopped mid-scan
+        self.progress.setMaximum(max(1, self.progress.maximum()))
+        self.progress.setValue(self.progress.maximum())
         self.btn_stop.setEnabled(False)
         self.btn_preview.setEnabled(True)
         self.btn_copy.setEnabled(True)
-        self.label_status.setText(f"Done. OK={ok} SKIP={skipped} FAIL={failed}")
-        QtWidgets.QMessageBox.information(
-            self,
-            "Finished",
-            f"Done.\nOK={ok} SKIP={skipped} FAIL={failed}\nLog:\n{log_path}",
-        )
+        self.btn_retry.setEnabled(bool(self._failed_pairs))
+        if self._shot_level:
+            # Quick dry-run emits (planned shots, shots missing a source, 0)
+            text = f"Dry-run done. PLANNED {ok} shot(s), missing {skipped}"
+        else:
+            text = f"Done. OK={ok} SKIP={skipped} FAIL={failed}"
+        self.label_status.setText(text)
+        show_finished(self, text.replace(". ", ".\n", 1), log_path)
 
 
 class NukeCopyWorker(QtCore.QObject):
-    progress = QtCore.Signal(int, int)
     status = QtCore.Signal(str)
-    finished = QtCore.Signal(int, int, int, int, str)
+    finished = QtCore.Signal(int, int, int, int, int, str)
     reads_ready = QtCore.Signal(list)
 
-    def __init__(self, nk_path: str, target_drive: str, max_workers: int, dryrun: bool, log_path: str):
+    def __init__(self, nk_path: str, target_drive: str, max_workers: int, dryrun: bool, log_path: str,
+                 small_workers: Optional[int] = None, large_workers: Optional[int] = None,
+                 skip_unchanged: bool = False):
         super().__init__()
         self.nk_path = nk_path
         self.target_drive = target_drive
         self.max_workers = max_workers
         self.dryrun = dryrun
         self.log_path = log_path
+        self.small_workers = small_workers
+        self.large_workers = large_workers
+        self.skip_unchanged = skip_unchanged
+        # [done, total] - written by the worker, polled by the tab's timer (same as ShotCopyWorker.counts)
+        self.counts = [0, 0]
 
     def run(self):
+        try:
+            self._run()
+        except Exception as e:
+            # Still emit finished so the tab stops its poll timer, quits the thread and re-enables Copy
+            self.finished.emit(0, 0, 0, 0, 0, f"Error: {e}")
+        finally:
+            nk.flush_log()  # an exception mid-job still leaves everything logged so far on disk
+
+    def _run(self):
         nk.DRY_RUN = self.dryrun
         nk.TARGET_DRIVE = self.target_drive
         nk.MAX_WORKERS = self.max_workers
+        # Copy pools sized to the destination storage (same knobs as --small-workers / --large-workers)
+        if self.small_workers:
+            nk.SMALL_WORKERS = self.small_workers
+        if self.large_workers:
+            nk.LARGE_WORKERS = self.large_workers
+        nk.SKIP_UNCHANGED = self.skip_unchanged
         nk.LOG_FILE = self.log_path
 
         with open(nk.LOG_FILE, "w", encoding="utf-8") as f:
             f.write("=== nuke copy reads log ===\n")
             f.write(f"Started at {datetime.datetime.now().isoformat()}\n")
             f.write(f"NK: {self.nk_path}\n")
-            f.write(f"DRY_RUN={nk.DRY_RUN}, TARGET_DRIVE={nk.TARGET_DRIVE}, MAX_WORKERS={nk.MAX_WORKERS}\n\n")
+            f.write(f"DRY_RUN={nk.DRY_RUN}, TARGET_DRIVE={nk.TARGET_DRIVE}, MAX_WORKERS={nk.MAX_WORKERS}, "
+                    f"SMALL_WORKERS={nk.SMALL_WORKERS}, LARGE_WORKERS={nk.LARGE_WORKERS}, "
+                    f"SKIP_UNCHANGED={nk.SKIP_UNCHANGED}\n\n")
 
+        # Phase messages only; per-file progress text is built by the tab from the polled counters
+        self.status.emit("Parsing .nk...")
         nk.log(f"開始解析 .nk：{self.nk_path}")
         reads = nk.parse_nk_for_reads(self.nk_path)
         nk.log(f"找到 Read/DeepRead 節點數量：{len(reads)}")
@@ -514,17 +1360,22 @@ class NukeCopyWorker(QtCore.QObject):
         sorted_entries = [unique_entries[key] for key in sorted(unique_entries)]
         self.reads_ready.emit(sorted_entries)
 
-        all_sources = []
+        # Dict as an ordered set (same as nk.main): dedup while expanding, no big list + sorted(set(...))
+        self.status.emit(f"Expanding {len(reads)} Read node(s)...")
+        unique_sources = {}
+        expanded_count = 0
         for r in reads:
-            all_sources.extend(nk.expand_read_to_files(r))
+            files = nk.expand_read_to_files(r)
+            expanded_count += len(files)
+            unique_sources.update(dict.fromkeys(files))
 
-        if not all_sources:
-            self.finished.emit(0, 0, 0, 0, "No source files found.")
+        if not unique_sources:
+            nk.flush_log()
+            self.finished.emit(0, 0, 0, 0, 0, "No source files found.")
             return
 
-        unique_sources = sorted(set(all_sources))
         total = len(unique_sources)
-        nk.log(f"展開後來源檔案數量：{len(all_sources)}")
+        nk.log(f"展開後來源檔案數量：{expanded_count}")
         nk.log(f"去重後實際要處理：{total}")
         nk.log(f"Log 檔案位置：{os.path.abspath(nk.LOG_FILE)}")
 
@@ -532,42 +1383,49 @@ class NukeCopyWorker(QtCore.QObject):
         missing = []
         errors = []
         dryrun_list = []
+        skipped = []
         done_count = 0
-
-        self.progress.emit(done_count, total)
-        self.status.emit("Copying 0/%d" % total)
+        counts = self.counts
+        counts[1] = total
 
         nk.log("開始平行複製檔案...")
-        with ThreadPoolExecutor(max_workers=nk.MAX_WORKERS) as executor:
-            future_to_src = {executor.submit(nk.copy_worker, src): src for src in unique_sources}
-            for fut in as_completed(future_to_src):
-                status, src, dst, err = fut.result()
-                done_count += 1
-                self.progress.emit(done_count, total)
-                self.status.emit(f"Copying {done_count}/{total}")
-
-                if status == "ok":
-                    success.append(src)
-                    nk.log(f"成功複製：{src}  ->  {dst}")
-                elif status == "dry_run":
-                    dryrun_list.append(src)
-                    nk.log(f"[DRY_RUN] 模擬複製：{src}  ->  {dst}")
-                elif status == "missing":
-                    missing.append(src)
-                    nk.log(f"❌ 找不到來源檔案：{src}")
-                elif status == "error":
-                    errors.append(src)
-                    nk.log(f"❌ 複製失敗：{src}  ->  {dst}  原因：{err}")
+        # Per-file lines go to nk.log_many in batches: one timestamp / print / queue put per LOG_BATCH
+        log_buf = []
+        for status, src, dst, err in nk.iter_copy_results(unique_sources):
+            done_count += 1
+            counts[0] = done_count
+
+            if status == "ok":
+                success.append(src)
+                log_buf.append(f"成功複製：{src}  ->  {dst}")
+            elif status == "dry_run":
+                dryrun_list.append(src)
+                log_buf.append(f"[DRY_RUN] 模擬複製：{src}  ->  {dst}")
+            elif status == "skipped":
+                skipped.append(src)
+                log_buf.append(f"略過（目標相同）：{src}  ->  {dst}")
+            elif status == "missing":
+                missing.append(src)
+                log_buf.append(f"❌ 找不到來源檔案：{src}")
+            elif status == "error":
+                errors.append(src)
+                log_buf.append(f"❌ 複製失敗：{src}  ->  {dst}  原因：{err}")
+            if len(log_buf) >= LOG_BATCH:
+                nk.log_many(log_buf)
+                log_buf.clear()
+        nk.log_many(log_buf)
 
         nk.log("========================================")
         nk.log("複製流程結束，統計如下：")
         nk.log(f"  成功複製：{len(success)}")
         nk.log(f"  模擬複製 (DRY_RUN)：{len(dryrun_list)}")
+        nk.log(f"  略過（目標相同）：{len(skipped)}")
         nk.log(f"  缺少來源檔案：{len(missing)}")
         nk.log(f"  複製失敗：{len(errors)}")
         nk.log("========================================")
+        nk.flush_log()
 
-        self.finished.emit(len(success), len(dryrun_list), len(missing), len(errors), "Done.")
+        self.finished.emit(len(success), len(dryrun_list), len(skipped), len(missing), len(errors), "Done.")
 
 
 class NukeCopyTab(QtWidgets.QWidget):
@@ -577,29 +1435,40 @@ class NukeCopyTab(QtWidgets.QWidget):
         self._worker = None
         self._log_path = None
         self._read_entries: List[Dict[str, str]] = []
+        self._read_keys: List[str] = []  # display strings currently in the model, same order
+        self._counts = [0, 0]
+        self._shown_counts = None
+        self._poll_timer = QtCore.QTimer(self)
+        self._poll_timer.setInterval(PROGRESS_POLL_MS)
+        self._poll_timer.timeout.connect(self._poll_progress)
         self._build_ui()
 
     @staticmethod
     def format_sequence_display(path: str, first: Optional[int], last: Optional[int]) -> str:
         if not path:
             return ""
-        display_path = path
+        pattern = frame_pattern(path) if first is not None and last is not None else None
+        if pattern:
+            # Fast path: frame numbers go straight into an f-string, no format string built and re-parsed
+            prefix, pad, suffix = pattern
+            start_dir, start_name = os.path.split(f"{prefix}{first:0{pad}d}{suffix}")
+            start_root, start_ext = os.path.splitext(start_name)
+            end_root = os.path.splitext(os.path.basename(f"{prefix}{last:0{pad}d}{suffix}"))[0]
+            return os.path.join(start_dir, f"{start_root}-{end_root}{start_ext}")
 
+        display_path = path
         if "#" in display_path and "%" not in display_path:
-            match = re.search(r"(#+)", display_path)
+            match = _HASH_RE.search(display_path)
             if match:
-                hashes = match.group(1)
-                pad = len(hashes)
-                display_path = display_path.replace(hashes, f"%0{pad}d")
+                hashes = match.group()
+                display_path = display_path.replace(hashes, f"%0{len(hashes)}d")
 
         if "%" in display_path and first is not None and last is not None:
             try:
-                start = display_path % first
-                end = display_path % last
-                start_dir, start_name = os.path.split(start)
-                _, end_name = os.path.split(end)
+                start_dir, start_name = os.path.split(display_path % first)
                 start_root, start_ext = os.path.splitext(start_name)
-                end_root, _ = os.path.splitext(end_name)
+                # Only the end frame's stem is needed; its folder and extension match the start
+                end_root = os.path.splitext(os.path.basename(display_path % last))[0]
                 return os.path.join(start_dir, f"{start_root}-{end_root}{start_ext}")
             except TypeError:
                 return display_path
@@ -629,20 +1498,45 @@ class NukeCopyTab(QtWidgets.QWidget):
         self.spin_max_workers = QtWidgets.QSpinBox()
         self.spin_max_workers.setRange(1, 32)
         self.spin_max_workers.setValue(nk.MAX_WORKERS)
+        self.spin_small_workers = QtWidgets.QSpinBox()
+        self.spin_small_workers.setRange(1, 256)
+        self.spin_small_workers.setValue(nk.SMALL_WORKERS)
+        self.spin_small_workers.setToolTip(f"Threads copying small files (< {nk.SMALL_FILE_LIMIT >> 20} MiB). "
+                                           "High counts hide per-file latency on network shares.")
+        self.spin_large_workers = QtWidgets.QSpinBox()
+        self.spin_large_workers.setRange(1, 64)
+        self.spin_large_workers.setValue(nk.LARGE_WORKERS)
+        self.spin_large_workers.setToolTip("Threads copying large files. A few are enough to saturate the link; "
+                                           "raise for fast NAS / SAN targets.")
         self.chk_dryrun = QtWidgets.QCheckBox("Dry-run (no actual copy)")
         self.chk_dryrun.setChecked(nk.DRY_RUN)
+        self.chk_skip_unchanged = QtWidgets.QCheckBox("Skip unchanged (same size + mtime)")
+        self.chk_skip_unchanged.setChecked(nk.SKIP_UNCHANGED)
 
         opts_layout.addWidget(QtWidgets.QLabel("Target Drive:"), 0, 0)
         opts_layout.addWidget(self.edit_target_drive, 0, 1)
         opts_layout.addWidget(QtWidgets.QLabel("Max Workers:"), 0, 2)
         opts_layout.addWidget(self.spin_max_workers, 0, 3)
         opts_layout.addWidget(self.chk_dryrun, 0, 4)
+        opts_layout.addWidget(QtWidgets.QLabel("Small-file Workers:"), 1, 0)
+        opts_layout.addWidget(self.spin_small_workers, 1, 1)
+        opts_layout.addWidget(QtWidgets.QLabel("Large-file Workers:"), 1, 2)
+        opts_layout.addWidget(self.spin_large_workers, 1, 3)
+        opts_layout.addWidget(self.chk_skip_unchanged, 1, 4)
 
         box_reads = QtWidgets.QGroupBox("Read Paths (from .nk)")
         layout.addWidget(box_reads, 1)
         reads_layout = QtWidgets.QVBoxLayout(box_reads)
-        self.list_reads = QtWidgets.QListWidget()
-        self.list_reads.itemDoubleClicked.connect(self._open_selected_read_folder)
+        # Model/view instead of QListWidget: one setStringList per parse, no QListWidgetItem per read
+        self.list_reads = QtWidgets.QListView()
+        self._reads_model = QtCore.QStringListModel(self.list_reads)
+        self.list_reads.setModel(self._reads_model)
+        self.list_reads.setUniformItemSizes(True)
+        # Lay rows out in chunks from the event loop, so the first paint doesn't wait on every row
+        self.list_reads.setLayoutMode(QtWidgets.QListView.Batched)
+        self.list_reads.setBatchSize(256)
+        self.list_reads.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.list_reads.doubleClicked.connect(self._open_selected_read_folder)
         reads_layout.addWidget(self.list_reads, 1)
 
         reads_btns = QtWidgets.QHBoxLayout()
@@ -687,22 +1581,24 @@ class NukeCopyTab(QtWidgets.QWidget):
         if not open_in_explorer(str(self._log_path)):
             QtWidgets.QMessageBox.warning(self, "Open Log", f"Log not found:\n{self._log_path}")
 
+    def _selected_read_row(self) -> Optional[int]:
+        indexes = self.list_reads.selectionModel().selectedIndexes()
+        return indexes[0].row() if indexes else None
+
     def _copy_selected_read_path(self):
-        items = self.list_reads.selectedItems()
-        if not items:
+        row = self._selected_read_row()
+        if row is None:
             QtWidgets.QMessageBox.warning(self, "Copy Path", "No read path selected.")
             return
-        row = self.list_reads.row(items[0])
         raw_path = self._read_entries[row]["raw"]
         QtWidgets.QApplication.clipboard().setText(raw_path)
         self.label_status.setText("Path copied to clipboard.")
 
     def _open_selected_read_folder(self):
-        items = self.list_reads.selectedItems()
-        if not items:
+        row = self._selected_read_row()
+        if row is None:
             QtWidgets.QMessageBox.warning(self, "Open Folder", "No read path selected.")
             return
-        row = self.list_reads.row(items[0])
         raw_path = self._read_entries[row]["raw"]
         folder = os.path.dirname(raw_path)
         if not open_in_explorer(folder):
@@ -726,7 +1622,10 @@ class NukeCopyTab(QtWidgets.QWidget):
 
         max_workers = int(self.spin_max_workers.value())
         dryrun = self.chk_dryrun.isChecked()
-        return nk_path, target_drive, max_workers, dryrun
+        small_workers = int(self.spin_small_workers.value())
+        large_workers = int(self.spin_large_workers.value())
+        skip_unchanged = self.chk_skip_unchanged.isChecked()
+        return nk_path, target_drive, max_workers, dryrun, small_workers, large_workers, skip_unchanged
 
     def _run_copy(self):
         if self._thread and self._thread.isRunning():
@@ -736,7 +1635,7 @@ class NukeCopyTab(QtWidgets.QWidget):
         settings = self._validate()
         if not settings:
             return
-        nk_path, target_drive, max_workers, dryrun = settings
+        nk_path, target_drive, max_workers, dryrun, small_workers, large_workers, skip_unchanged = settings
 
         base_dir = get_base_dir()
         log_dir = base_dir / "log"
@@ -745,38 +1644,69 @@ class NukeCopyTab(QtWidgets.QWidget):
 
         self.progress.setValue(0)
         self.label_status.setText("Parsing...")
-        self.list_reads.clear()
-        self._read_entries = []
+        # The previous list stays up (entries and rows still aligned) until the new one arrives,
+        # so re-running the same script only touches the rows that changed
 
         self._thread = QtCore.QThread(self)
-        self._worker = NukeCopyWorker(nk_path, target_drive, max_workers, dryrun, str(self._log_path))
+        self._worker = NukeCopyWorker(nk_path, target_drive, max_workers, dryrun, str(self._log_path),
+                                      small_workers, large_workers, skip_unchanged)
         self._worker.moveToThread(self._thread)
         self._thread.started.connect(self._worker.run)
-        self._worker.progress.connect(self._update_progress)
+        self._counts = self._worker.counts
+        self._shown_counts = None
         self._worker.status.connect(self.label_status.setText)
         self._worker.reads_ready.connect(self._update_read_list)
         self._worker.finished.connect(self._finish_copy)
         self._worker.finished.connect(self._thread.quit)
         self._worker.finished.connect(self._worker.deleteLater)
         self._thread.finished.connect(self._thread.deleteLater)
+        self._poll_timer.start()
         self._thread.start()
 
     def _update_read_list(self, entries: list):
         self._read_entries = entries
-        self.list_reads.clear()
-        for entry in entries:
-            self.list_reads.addItem(entry["display"])
+        new = [entry["display"] for entry in entries]
+        old = self._read_keys
+        self._read_keys = new
+        if new == old:
+            return
+        # Both lists are sorted and unique, so dropping the removed rows and inserting the added
+        # ones in ascending order turns old into new; a big change is cheaper as one reset
+        new_set, old_set = set(new), set(old)
+        removed = [i for i, d in enumerate(old) if d not in new_set]
+        added = [i for i, d in enumerate(new) if d not in old_set]
+        if not old or len(removed) + len(added) > len(new) * 0.3:
+            self._reads_model.setStringList(new)
+            return
+        model = self._reads_model
+        for i in reversed(removed):
+            model.removeRows(i, 1)
+        for i in added:
+            model.insertRows(i, 1)
+            model.setData(model.index(i), new[i])
+
+    def _poll_progress(self):
+        counts = tuple(self._counts)
+        if counts != self._shown_counts:
+            self._shown_counts = counts
+            self._update_progress(*counts)
 
     def _update_progress(self, i: int, total: int):
-        self.progress.setMaximum(total)
+        if not total:
+            return  # still parsing: keep the worker's status text
+        if self.progress.maximum() != total:
+            self.progress.setMaximum(total)
         self.progress.setValue(i)
+        self.label_status.setText(f"Copying {i}/{total}")
 
-    def _finish_copy(self, success: int, dryrun: int, missing: int, errors: int, msg: str):
+    def _finish_copy(self, success: int, dryrun: int, skipped: int, missing: int, errors: int, msg: str):
+        self._poll_timer.stop()
+        self._poll_progress()
         self.label_status.setText(msg)
-        QtWidgets.QMessageBox.information(
+        show_finished(
             self,
-            "Finished",
-            f"{msg}\nSuccess: {success}\nDry-run: {dryrun}\nMissing: {missing}\nErrors: {errors}\nLog:\n{self._log_path}",
+            f"{msg}\nSuccess: {success}\nDry-run: {dryrun}\nSkipped: {skipped}\nMissing: {missing}\nErrors: {errors}",
+            str(self._log_path),
         )
 
 
@@ -800,6 +1730,7 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # needed for the copy processes in the PyInstaller exe
     main()
 
 